@@ -0,0 +1,140 @@
+"""Page images: pre-built static variants and an in-memory store of the originals.
+
+The variants are written by `python -m tools.build_assets` into `static/`, which Streamlit serves
+at `/app/static/` when `server.enableStaticServing` is on. Without the manifest or static serving,
+images are sent from the in-memory store, whose identical bytes map to one media URL for all sessions.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import streamlit as st
+
+DATA_DIR = Path("data")
+STATIC_DIR = Path("static")
+VARIANT_DIR = STATIC_DIR / "img"
+MANIFEST_PATH = Path("build/assets.json")
+
+# Width of the main column in the "centered" layout; images never display wider than this.
+CONTENT_WIDTH = 704
+WIDTHS = [CONTENT_WIDTH // 2, CONTENT_WIDTH]
+FORMATS = {"webp": {"quality": 85, "method": 6}, "avif": {"quality": 60}}
+
+# Images beyond this many bytes are not kept in memory and are read from disk on each use instead.
+STORE_LIMIT = 32 * 1024 * 1024
+
+
+class AssetStore:
+    """Image files read once and shared by every session, keyed by content hash."""
+
+    def __init__(self, paths: list[Path], limit: int = STORE_LIMIT):
+        self.limit = limit
+        self.size = 0
+        self._blobs = {}
+        self._digests = {}
+        for path in paths:
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if digest not in self._blobs:
+                if self.size + len(data) > limit:
+                    continue
+                self._blobs[digest] = data
+                self.size += len(data)
+            self._digests[path.as_posix()] = digest
+
+    def get(self, path: str) -> bytes | None:
+        digest = self._digests.get(path)
+        return None if digest is None else self._blobs[digest]
+
+    def stats(self) -> dict:
+        return {"files": len(self._blobs), "bytes": self.size, "limit": self.limit}
+
+
+@st.cache_resource(show_spinner=False)
+def get_store() -> AssetStore:
+    return AssetStore(sorted(DATA_DIR.glob("*.png")))
+
+
+def build(source: Path) -> dict:
+    """Write the variants of one image and return its manifest entry."""
+    from PIL import Image, features
+
+    with Image.open(source) as image:
+        image.load()
+    entry = {"width": image.width, "height": image.height, "variants": []}
+    widths = sorted({w for w in WIDTHS if w < image.width} | {image.width})
+    for fmt, options in FORMATS.items():
+        if not features.check(fmt):
+            continue
+        for width in widths:
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            out = VARIANT_DIR / f"{source.stem}-{width}.{fmt}"
+            resized.save(out, fmt.upper(), **options)
+            data = out.read_bytes()
+            # Content-hash in the name, so a changed image never reuses a cached URL.
+            name = out.with_name(f"{source.stem}-{width}.{hashlib.sha256(data).hexdigest()[:10]}.{fmt}")
+            out.replace(name)
+            entry["variants"].append({
+                "file": name.relative_to(STATIC_DIR).as_posix(),
+                "format": fmt,
+                "width": width,
+                "bytes": len(data),
+            })
+    return entry
+
+
+@st.cache_resource(show_spinner=False)
+def _load_manifest(mtime: float) -> dict:
+    return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+
+def manifest_mtime() -> float:
+    return MANIFEST_PATH.stat().st_mtime if MANIFEST_PATH.is_file() else 0.0
+
+
+def load_manifest() -> dict:
+    mtime = manifest_mtime()
+    return _load_manifest(mtime) if mtime else {}
+
+
+def resolve(path: str, width: int = CONTENT_WIDTH, fmt: str = "webp") -> str:
+    """Return the URL of the smallest `fmt` variant at least `width` pixels wide, or `path` itself."""
+    entry = load_manifest().get(path)
+    if entry is None or not st.get_option("server.enableStaticServing"):
+        return path
+    width = min(width, entry["width"])
+    variants = [v for v in entry["variants"] if v["format"] == fmt and v["width"] >= width]
+    if not variants:
+        return path
+    variant = min(variants, key=lambda v: v["width"])
+    return f"/app/static/{variant['file']}"
+
+
+def picture(path: str, width: int = CONTENT_WIDTH) -> str | None:
+    """HTML for the variants of `path`: AVIF where the browser supports it, WebP otherwise.
+
+    Each format lists all of its widths, so the browser picks the smallest one for the screen.
+    The URLs are relative, so they also work under a `server.baseUrlPath`. None when `resolve()`
+    would return `path` itself.
+    """
+    src = resolve(path, width)
+    if src == path:
+        return None
+    srcsets = {}
+    for variant in load_manifest()[path]["variants"]:
+        srcsets.setdefault(variant["format"], []).append(f"app/static/{variant['file']} {variant['width']}w")
+    sizes = f"(max-width: {width}px) 100vw, {width}px"
+    sources = "".join(
+        f'<source type="image/{fmt}" srcset="{", ".join(srcset)}" sizes="{sizes}">' for fmt, srcset in srcsets.items() if fmt != "webp"
+    )
+    return f'<picture>{sources}<img src="{src.lstrip("/")}" srcset="{", ".join(srcsets["webp"])}" sizes="{sizes}" alt=""></picture>'
+
+
+def image(path: str, **kwargs):
+    url = resolve(path)
+    data = get_store().get(path) if url == path else None
+    if data is None:
+        return st.image(url, **kwargs)
+    # The store only holds PNGs; naming the format spares st.image from sniffing it again.
+    return st.image(data, output_format="PNG", **kwargs)
@@ -0,0 +1,149 @@
+"""A function mapped over many inputs on the shared scheduler, with results streamed back by chunk.
+
+    batch = BatchMap(get_scheduler(), count_primes, inputs)
+    ...
+    results, cursor = batch.read(cursor)  # (index, value) pairs finished since the last read
+
+Inputs are sent in chunks, one task per chunk, so a thousand small inputs cost a few dozen round
+trips instead of a thousand. The chunks are guide.scheduler tasks of the session that started
+the batch, at low priority. They may run on every worker at once, not just the one a session's
+task gets, but the session's limit on waiting tasks applies, and a waiting task of higher
+priority is handed the next free worker first. A few chunks are submitted at a time and more as
+they complete, and results are collected in the order they complete, so the first ones can be
+shown while the rest are still running. `stream()` does that in a fragment that polls only
+while the batch runs.
+
+A batch stops submitting chunks once it is cancelled, or once nothing holds it any more, for
+example when its session has ended.
+"""
+import threading
+import weakref
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import streamlit as st
+
+from guide import launcher, polling, workloads
+from guide.scheduler import LOW, QuotaExceeded, Scheduler, session_id
+
+MAX_INPUTS = 2000
+# Chunks are small enough for every worker to get this many, so early results arrive early and
+# the work stays balanced, but never larger than MAX_CHUNKSIZE.
+CHUNKS_PER_WORKER = 8
+MAX_CHUNKSIZE = 64
+# Chunks submitted to the scheduler and not yet collected, beyond one per worker; below its `max_queued`.
+WINDOW = 2
+
+
+def chunksize(total: int, workers: int = launcher.MAX_WORKERS) -> int:
+    return max(1, min(MAX_CHUNKSIZE, total // (workers * CHUNKS_PER_WORKER)))
+
+
+class _Results:
+    def __init__(self):
+        self.pairs = []
+        self.completed = 0
+        self.error = None
+        self.lock = threading.Lock()
+
+
+def _collect(scheduler: Scheduler, fn, chunks: list, session: str, results: _Results, stop: threading.Event):
+    # Runs without a reference to the BatchMap, so dropping the BatchMap can stop it.
+    chunks = iter(chunks)
+    pending = {}
+    chunk = next(chunks, None)
+    workers = scheduler.max_workers
+    while True:
+        while chunk is not None and len(pending) < workers + WINDOW and not stop.is_set():
+            start, items = chunk
+            try:
+                future = scheduler.submit(workloads.map_chunk, fn, items, session=session, priority=LOW, per_session=workers)
+            except QuotaExceeded:
+                break
+            # Identical chunks share one future, so a future may stand for several.
+            pending.setdefault(future, []).append(start)
+            chunk = next(chunks, None)
+        if not pending:
+            if chunk is None or stop.is_set():
+                return
+            # Over quota with nothing of ours running: wait for the session's other tasks.
+            stop.wait(polling.POLL_INTERVAL)
+            continue
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            starts = pending.pop(future)
+            try:
+                values = future.result()
+            except Exception as e:
+                results.error = e
+                stop.set()
+                continue
+            with results.lock:
+                for start in starts:
+                    results.pairs.extend(enumerate(values, start))
+                    results.completed += len(values)
+
+
+class BatchMap:
+    def __init__(self, scheduler: Scheduler, fn, inputs, size: int | None = None, session: str | None = None):
+        """Map `fn` over `inputs` (at most MAX_INPUTS) as tasks of `session`, the current one by default."""
+        inputs = list(inputs)
+        if len(inputs) > MAX_INPUTS:
+            raise ValueError(f"at most {MAX_INPUTS} inputs can be mapped at once, not {len(inputs)}")
+        size = size or chunksize(len(inputs), scheduler.max_workers)
+        self.total = len(inputs)
+        self._results = _Results()
+        self._stop = threading.Event()
+        chunks = [(i, inputs[i:i + size]) for i in range(0, len(inputs), size)]
+        session = session_id() if session is None else session
+        self._collector = threading.Thread(
+            target=_collect, args=(scheduler, fn, chunks, session, self._results, self._stop), name="batch", daemon=True
+        )
+        self._collector.start()
+        weakref.finalize(self, self._stop.set)
+
+    @property
+    def completed(self) -> int:
+        return self._results.completed
+
+    @property
+    def error(self) -> Exception | None:
+        return self._results.error
+
+    @property
+    def done(self) -> bool:
+        return not self._collector.is_alive()
+
+    def read(self, cursor: int = 0) -> tuple[list[tuple[int, object]], int]:
+        """The `(index, value)` pairs collected since `cursor`, in completion order, and the next cursor."""
+        with self._results.lock:
+            return self._results.pairs[cursor:], len(self._results.pairs)
+
+    def cancel(self):
+        """Submit no more chunks; the ones already submitted still finish."""
+        self._stop.set()
+
+
+def _stream(batch: BatchMap, key: str, render):
+    import pandas as pd
+
+    view = st.session_state.get(key)
+    if view is None or view["batch"] is not batch:
+        view = st.session_state[key] = {"batch": batch, "cursor": 0, "frames": []}
+    results, view["cursor"] = batch.read(view["cursor"])
+    if results:
+        view["frames"].append(pd.DataFrame(results, columns=["index", "value"]))
+    st.progress(batch.completed / batch.total if batch.total else 1.0, f"{batch.completed:,} / {batch.total:,}")
+    if batch.error is not None:
+        st.error(batch.error)
+    if view["frames"]:
+        # Only the new results are converted each time; the frames collected so far are reused.
+        render(pd.concat(view["frames"], ignore_index=True))
+
+
+def stream(batch: BatchMap, key: str, render):
+    """Show the batch's progress and `render(results)` for the results so far, refreshed while it runs.
+
+    `results` is a DataFrame of `index` and `value` in completion order; `key` holds this session's
+    place in the batch.
+    """
+    polling.poll(_stream, lambda: not batch.done, batch, key, render)
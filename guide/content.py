@@ -0,0 +1,218 @@
+"""Page content: parsing, compiling into per-language bundles and rendering.
+
+Each page lives in `contents/<page>_<lang>.md`. Lines starting with `::` are directives,
+everything else is the body of the directive above it:
+
+    ::page <page title>          st.set_page_config(page_title=...)
+    ::title <text>               st.title
+    ::section <id> <heading>     starts a section, rendered as st.subheader
+    ::markdown / ::warning / ::caption
+    ::image <path>
+    ::expander <label>  ...  ::end
+
+`{nl}` in a body is a Markdown line break (two trailing spaces).
+
+Expanders are lazy: their body is rendered and sent only while the reader has them open.
+"""
+import hashlib
+import pickle
+from pathlib import Path
+
+import streamlit as st
+
+from guide import assets, profiler
+
+CONTENT_DIR = Path("contents")
+BUILD_DIR = Path("build")
+PAGES = ["introduction", "handson", "tips"]
+LANGUAGES = ["en", "jp"]
+
+nl = "  "
+
+_BODY = {"markdown", "warning", "caption"}
+
+
+def source_path(page: str, lang: str) -> Path:
+    return CONTENT_DIR / f"{page}_{lang}.md"
+
+
+def bundle_path(lang: str) -> Path:
+    return BUILD_DIR / f"content_{lang}.bundle"
+
+
+def parse(text: str) -> dict:
+    """Parse a content source into `{"page_title", "title", "sections"}`.
+
+    A section is `{"id", "heading", "nodes"}`; the section before the first `::section` has no heading.
+    A node is `[name, args, kwargs, children]`, i.e. one `st.<name>(*args, **kwargs)` call. The page
+    config, title and subheaders are nodes too, so replaying every section renders the whole page.
+    """
+    page = {"page_title": None, "title": None, "sections": [{"id": None, "heading": None, "nodes": []}]}
+    stack = [page["sections"][0]["nodes"]]
+    node, lines = None, None
+    section_id, expanders = "top", 0
+
+    def close():
+        if lines is not None:
+            node[1].append("\n".join(lines).strip().replace("{nl}", nl))
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if not line.startswith("::"):
+            if lines is not None:
+                lines.append(line)
+            elif line.strip():
+                raise ValueError(f"line {lineno}: text outside of a directive")
+            continue
+
+        close()
+        lines = None
+        name, _, arg = line[2:].partition(" ")
+        if name == "page":
+            page["page_title"] = arg
+            stack[-1].append(["set_page_config", [], {"page_title": arg}, []])
+        elif name == "title":
+            page["title"] = arg
+            stack[-1].append(["title", [arg], {}, []])
+        elif name == "section":
+            if len(stack) > 1:
+                raise ValueError(f"line {lineno}: section inside an expander")
+            section_id, _, heading = arg.partition(" ")
+            expanders = 0
+            page["sections"].append({"id": section_id, "heading": heading, "nodes": []})
+            stack = [page["sections"][-1]["nodes"]]
+            stack[-1].append(["subheader", [heading], {"divider": True, "anchor": section_id}, []])
+        elif name in _BODY:
+            node, lines = [name, [], {}, []], []
+            stack[-1].append(node)
+        elif name == "image":
+            stack[-1].append([name, [arg], {}, []])
+        elif name == "expander":
+            # With a key and on_change="rerun", opening the expander reruns its section's fragment.
+            node = [name, [arg], {"key": f"{section_id}-expander-{expanders}", "on_change": "rerun"}, []]
+            expanders += 1
+            stack[-1].append(node)
+            stack.append(node[3])
+        elif name == "end":
+            if len(stack) == 1:
+                raise ValueError(f"line {lineno}: ::end without ::expander")
+            stack.pop()
+        else:
+            raise ValueError(f"line {lineno}: unknown directive ::{name}")
+    close()
+    return page
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def compile_bundle(lang: str) -> dict:
+    bundle = {"sources": {}, "pages": {}}
+    for page in PAGES:
+        data = source_path(page, lang).read_bytes()
+        bundle["sources"][page] = _digest(data)
+        bundle["pages"][page] = parse(data.decode("utf-8"))
+    return bundle
+
+
+def write_bundle(lang: str) -> Path:
+    out = bundle_path(lang)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(pickle.dumps(compile_bundle(lang), pickle.HIGHEST_PROTOCOL))
+    return out
+
+
+def _is_fresh(bundle: dict, lang: str) -> bool:
+    return all(bundle["sources"].get(page) == _digest(source_path(page, lang).read_bytes()) for page in PAGES)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_bundle(lang: str, mtime: float) -> dict:
+    out = bundle_path(lang)
+    if out.is_file():
+        bundle = pickle.loads(out.read_bytes())
+        if _is_fresh(bundle, lang):
+            return bundle
+    # No (or an outdated) compiled bundle: compile in memory so the app still works without a build step.
+    return compile_bundle(lang)
+
+
+def load_bundle(lang: str) -> dict:
+    """Return the compiled content of every page in `lang`, loaded once per process."""
+    mtime = max(source_path(page, lang).stat().st_mtime for page in PAGES)
+    return _load_bundle(lang, mtime)
+
+
+# Markdown kwargs that can be merged: none, or the HTML of images (see `coalesce`).
+_HTML = {"unsafe_allow_html": True}
+
+
+def coalesce(nodes: list) -> list:
+    """Merge runs of markdown nodes, and images with static variants between them, into one markdown node.
+
+    The page looks the same, but each run is sent as one delta instead of several. Images become
+    `<picture>` HTML (guide.assets.picture), so a merged run allows HTML; the sources are the
+    guide's own, and their only `<` are in code, which is never read as HTML.
+    """
+    merged = []
+    for name, args, kwargs, children in nodes:
+        if name == "image" and not kwargs:
+            html = assets.picture(args[0])
+            if html is not None:
+                name, args, kwargs = "markdown", [html], _HTML
+        if name == "markdown" and kwargs in ({}, _HTML) and merged and merged[-1][0] == "markdown" and merged[-1][2] in ({}, _HTML):
+            merged[-1] = ["markdown", [f"{merged[-1][1][0]}\n\n{args[0]}"], merged[-1][2] or kwargs, []]
+        else:
+            merged.append([name, args, kwargs, coalesce(children)])
+    return merged
+
+
+@st.cache_resource(show_spinner=False)
+def _sections(lang: str, mtime: float, manifest_mtime: float) -> dict:
+    pages = load_bundle(lang)["pages"]
+    return {page: [{**s, "nodes": coalesce(s["nodes"])} for s in data["sections"]] for page, data in pages.items()}
+
+
+def sections(page: str, lang: str) -> list[dict]:
+    """The sections of a page, ready to render (see `coalesce`)."""
+    mtime = max(source_path(p, lang).stat().st_mtime for p in PAGES)
+    return _sections(lang, mtime, assets.manifest_mtime())[page]
+
+
+# Node names rendered by something other than the `st` function of the same name.
+_RENDERERS = {"image": assets.image}
+
+
+def replay(nodes: list):
+    for name, args, kwargs, children in nodes:
+        with profiler.call(name):
+            element = _RENDERERS.get(name, getattr(st, name))(*args, **kwargs)
+            # A collapsed lazy expander reports open=False; skip its body until it is opened.
+            if children and getattr(element, "open", None) is not False:
+                with element:
+                    replay(children)
+
+
+@st.fragment
+def section(nodes: list):
+    """Render one section as a fragment: a widget inside it reruns only this section."""
+    replay(nodes)
+
+
+def toc(page: str, lang: str) -> list[tuple[str, str]]:
+    """The `(id, heading)` of every section of a page, in order."""
+    return [(s["id"], s["heading"]) for s in load_bundle(lang)["pages"][page]["sections"] if s["heading"] is not None]
+
+
+def render(page: str, lang: str, section_id: str | None = None):
+    """Render the whole page, or only the part above the first section and the section `section_id`.
+
+    The part above the first section has the page config, the title and the page's introduction.
+    """
+    page_sections = sections(page, lang)
+    if section_id is None:
+        for data in page_sections:
+            section(data["nodes"])
+        return
+    section(page_sections[0]["nodes"])
+    section(next(s["nodes"] for s in page_sections if s["id"] == section_id))
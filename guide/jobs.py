@@ -0,0 +1,255 @@
+"""Background jobs shared by every session.
+
+A job is a function run in a worker process of its own. At most `max_workers` jobs run at once and
+the rest wait in submission order. The function is called with a `progress` keyword argument, a
+callable taking the fraction done, and its return value becomes the job's result:
+
+    def heavy_job(n, progress):
+        for i in range(n):
+            ...
+            progress((i + 1) / n)
+        return {"summary": "Processing completed"}
+
+    job_id = get_manager().submit(heavy_job, 10)
+
+Workers write progress into a shared memory slot (guide.shm.Counters), one per running job, and
+send only their outcome through a queue. One thread in the app process reads the slots and the
+queue for every worker, so pages only read job state and never drain queues themselves. A slot
+is reused only once its worker has exited. `watch()` shows jobs in a fragment that polls by
+itself while any of them is unfinished, without rerunning the rest of the page.
+
+Every change is also written to a guide.jobstore database, so `get()` still finds a job that has
+dropped out of memory, including one from before a server restart.
+"""
+import queue
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from functools import partial
+
+import streamlit as st
+
+from guide import launcher, polling, shm, workloads
+from guide.jobstore import JobStore
+
+PENDING, RUNNING, DONE, FAILED, CANCELLED = "pending", "running", "done", "failed", "cancelled"
+FINISHED = {DONE, FAILED, CANCELLED}
+
+# Finished jobs are forgotten after this many seconds.
+RETAIN_SECONDS = 3600
+
+
+class Job:
+    def __init__(self, job_id: str, fn, args: tuple, kwargs: dict):
+        self.id = job_id
+        self.name = getattr(fn, "__name__", "job")
+        self.status = PENDING
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self._call = (fn, args, kwargs)
+        self._process = None
+        self._slot = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED
+
+    def record(self) -> dict:
+        return {f: getattr(self, f) for f in ["id", "name", "status", "progress", "result", "error", "submitted", "started", "finished"]}
+
+    @classmethod
+    def from_record(cls, record: dict) -> "Job":
+        job = cls.__new__(cls)
+        job.__dict__.update(record, _call=None, _process=None, _slot=None)
+        return job
+
+
+class JobManager:
+    def __init__(self, max_workers: int = launcher.MAX_WORKERS, context=None, store: JobStore | None = None):
+        self.max_workers = max_workers
+        self._store = store
+        if store is not None:
+            # Workers do not outlive the server, so what a server that is gone left unfinished is lost.
+            # Jobs of live processes, this one included, are theirs to finish.
+            store.interrupt([PENDING, RUNNING], FAILED, "interrupted: the server restarted")
+            store.prune()
+        self._ctx = context or launcher.get_context()
+        self._events = self._ctx.Queue()
+        self._progress = shm.Counters(max_workers)
+        self._free_slots = list(range(max_workers))
+        self._close_progress = weakref.finalize(self, self._progress.close)
+        self._jobs = {}
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._pumping = threading.Thread(target=self._pump, name="job-manager", daemon=True)
+        self._pumping.start()
+
+    def submit(self, fn, *args, **kwargs) -> str:
+        """Queue `fn(*args, progress=..., **kwargs)` and return the job ID. `fn` must be picklable."""
+        job = Job(uuid.uuid4().hex[:12], fn, args, kwargs)
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("the job manager has been shut down")
+            self._jobs[job.id] = job
+            self._pending.append(job)
+            self._save(job)
+            self._start_pending()
+        return job.id
+
+    def get(self, job_id: str) -> Job | None:
+        job = self._jobs.get(job_id)
+        if job is None and self._store is not None:
+            record = self._store.load(job_id)
+            job = record and Job.from_record(record)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Drop a pending job or terminate a running one. Returns False if it had already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.done:
+                return False
+            if job.status == PENDING:
+                self._pending.remove(job)
+            else:
+                job._process.terminate()
+                job._process.join(timeout=1)
+            self._finish(job, CANCELLED)
+            self._start_pending()
+        return True
+
+    def shutdown(self):
+        """Stop the manager: unfinished jobs are terminated and recorded as failed."""
+        self._closed.set()
+        self._pumping.join()
+        with self._lock:
+            self._pending.clear()
+            for job in self._jobs.values():
+                if job.status == RUNNING:
+                    job._process.terminate()
+                    job._process.join(timeout=1)
+                if not job.done:
+                    self._finish(job, FAILED, error="interrupted: the job manager was shut down")
+        self._events.close()
+        self._close_progress()
+
+    def stats(self) -> dict:
+        counts = dict.fromkeys([PENDING, RUNNING, DONE, FAILED, CANCELLED], 0)
+        for job in list(self._jobs.values()):
+            counts[job.status] += 1
+        return counts
+
+    def _save(self, *jobs: Job):
+        if self._store is not None and jobs:
+            self._store.save(*(job.record() for job in jobs))
+
+    def _running(self) -> list[Job]:
+        return [job for job in self._jobs.values() if job.status == RUNNING]
+
+    def _release_slots(self):
+        # A worker that has reported, or been terminated, may still be exiting; until it has, it
+        # could still write to its slot.
+        for job in self._jobs.values():
+            if job.done and job._slot is not None and job._process.exitcode is not None:
+                self._free_slots.append(job._slot)
+                job._slot = None
+
+    def _start_pending(self):
+        # Every running job holds a slot, and so does a finished one whose worker has not exited.
+        self._release_slots()
+        while self._pending and self._free_slots:
+            job = self._pending.popleft()
+            fn, args, kwargs = job._call
+            job._slot = self._free_slots.pop()
+            self._progress[job._slot] = 0.0
+            job._process = self._ctx.Process(
+                target=workloads.run_job, args=(job.id, fn, args, kwargs, self._events, self._progress.name, job._slot), daemon=True
+            )
+            with launcher.detached_main():
+                job._process.start()
+            job.status = RUNNING
+            job.started = time.time()
+            self._save(job)
+
+    def _finish(self, job: Job, status: str, result=None, error: str | None = None):
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished = time.time()
+        if status == DONE:
+            job.progress = 1.0
+        job._call = None
+        self._save(job)
+
+    def _handle(self, job_id: str, kind: str, value):
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return
+        if kind == DONE:
+            self._finish(job, DONE, result=value)
+        else:
+            self._finish(job, FAILED, error=value)
+
+    def _pump(self):
+        while not self._closed.is_set():
+            # Note exited workers before reading events: whatever one sent before exiting is then
+            # already in the queue, so only a worker that died without reporting is failed below.
+            exited = [job for job in self._running() if job._process.exitcode is not None]
+            events = []
+            try:
+                events.append(self._events.get(timeout=polling.POLL_INTERVAL))
+                while True:
+                    events.append(self._events.get_nowait())
+            except queue.Empty:
+                pass
+            with self._lock:
+                for event in events:
+                    self._handle(*event)
+                # Progress is taken from the slots once per round, however often the jobs report it.
+                progressed = []
+                for job in self._running():
+                    if self._progress[job._slot] != job.progress:
+                        job.progress = self._progress[job._slot]
+                        progressed.append(job)
+                self._save(*progressed)
+                for job in exited:
+                    if not job.done:
+                        self._finish(job, FAILED, error=f"worker exited with code {job._process.exitcode}")
+                now = time.time()
+                for job in [job for job in self._jobs.values() if job.done and now - job.finished > RETAIN_SECONDS]:
+                    del self._jobs[job.id]
+                self._start_pending()
+
+
+@st.cache_resource(show_spinner=False, on_release=JobManager.shutdown)
+def get_manager() -> JobManager:
+    return JobManager(store=JobStore())
+
+
+def _active(job_ids: list[str]) -> bool:
+    return any(job is not None and not job.done for job in map(get_manager().get, job_ids))
+
+
+def _watch(job_ids: list[str], lang: str):
+    manager = get_manager()
+    for job in filter(None, map(manager.get, job_ids)):
+        col1, col2 = st.columns([4, 1], vertical_alignment="bottom")
+        label = f"{job.name} `{job.id}`: {job.status}"
+        col1.progress(job.progress, f"{label} → {job.result}" if job.status == DONE else label)
+        if not job.done and col2.button("中止" if lang == "jp" else "Cancel", key=f"cancel-{job.id}"):
+            manager.cancel(job.id)
+            st.rerun(scope="fragment")
+        if job.status == FAILED:
+            st.code(job.error)
+
+
+def watch(job_ids: list[str], lang: str):
+    """Show progress and a cancel button for each job, refreshed while any is unfinished."""
+    polling.poll(_watch, partial(_active, job_ids), job_ids, lang)
@@ -0,0 +1,105 @@
+"""Job records kept on disk, so a job outlives the session that started it.
+
+`st.session_state` is gone after a reload, a disconnect or a timeout, and with it the IDs of the
+session's jobs. guide.jobs writes every job to a SQLite database in `build/` and the page keeps
+the IDs in the URL (`?job=<id>`), so a reloaded tab finds its jobs again, running or finished,
+and never starts them over.
+
+Each row also names the process that runs the job (its PID and start time, so a reused PID is not
+mistaken for it). After a server restart, jobs whose process is gone are marked failed, since
+their workers went with it; jobs of another live process using the same directory are left alone.
+"""
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+STORE_PATH = Path("build/jobs.sqlite3")
+# Finished jobs are deleted from the store after this many seconds.
+RETAIN_SECONDS = 7 * 24 * 3600
+
+_FIELDS = ["id", "name", "status", "progress", "result", "error", "submitted", "started", "finished"]
+
+
+def _start_time(pid: int) -> str | None:
+    """When process `pid` started, in clock ticks since boot; None if it does not exist."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # The command name in parentheses may contain spaces; the fields after it do not.
+            return f.read().rpartition(")")[2].split()[19]
+    except FileNotFoundError:
+        return None
+
+
+def process_owner() -> str:
+    """This process as the owner of jobs: "<pid>:<start time>", or "<pid>:" without /proc."""
+    pid = os.getpid()
+    return f"{pid}:{_start_time(pid) if os.path.isdir('/proc') else ''}"
+
+
+def _alive(owner: str | None) -> bool:
+    if owner is None:
+        return False
+    pid, _, started = owner.partition(":")
+    pid = int(pid)
+    if started:
+        return _start_time(pid) == started
+    if sys.platform == "win32":
+        # os.kill would terminate the process; only this one is known to be alive.
+        return pid == os.getpid()
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class JobStore:
+    def __init__(self, path: Path = STORE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.owner = process_owner()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, name TEXT, status TEXT, progress REAL,"
+            " result BLOB, error TEXT, submitted REAL, started REAL, finished REAL, owner TEXT)"
+        )
+        if "owner" not in {column[1] for column in self._db.execute("PRAGMA table_info(jobs)")}:
+            # A store from before owners were recorded; its rows have none.
+            self._db.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+        self._lock = threading.Lock()
+
+    def save(self, *records: dict):
+        """Write `records`, owned by this process."""
+        rows = [[*(pickle.dumps(r["result"]) if f == "result" else r[f] for f in _FIELDS), self.owner] for r in records]
+        columns = [*_FIELDS, "owner"]
+        with self._lock:
+            self._db.executemany(f"INSERT OR REPLACE INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+
+    def load(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._db.execute(f"SELECT {', '.join(_FIELDS)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        record = dict(zip(_FIELDS, row))
+        record["result"] = pickle.loads(record["result"])
+        return record
+
+    def interrupt(self, statuses: list[str], status: str, error: str):
+        """Mark the jobs in one of `statuses` whose process is gone as `status` with `error`: the ones a restart orphaned."""
+        placeholders = ", ".join("?" * len(statuses))
+        with self._lock:
+            owners = [owner for (owner,) in self._db.execute(f"SELECT DISTINCT owner FROM jobs WHERE status IN ({placeholders})", statuses)]
+            self._db.executemany(
+                f"UPDATE jobs SET status = ?, error = ?, finished = ? WHERE owner IS ? AND status IN ({placeholders})",
+                [(status, error, time.time(), owner, *statuses) for owner in owners if not _alive(owner)],
+            )
+
+    def prune(self, retain: float = RETAIN_SECONDS):
+        with self._lock:
+            self._db.execute("DELETE FROM jobs WHERE finished < ?", (time.time() - retain,))
@@ -0,0 +1,113 @@
+"""Fast worker process start.
+
+A spawned worker starts a fresh interpreter and imports everything it needs again, which takes
+seconds. And under `streamlit run` it also re-runs the page script: Streamlit installs the script
+as `__main__`, and multiprocessing executes a `__main__` with a file path in every spawned child.
+
+Here workers are forked from a forkserver that has already imported PRELOAD (the
+`GUIDE_PRELOAD` environment variable, a comma-separated module list, overrides it), and they are
+started with the page script hidden from multiprocessing. `pool()` also starts all of its workers
+ahead of the first task, so that task does not pay for a start at all.
+
+Windows has no forkserver; there the start method is spawn and only the page script is skipped.
+"""
+import multiprocessing as mp
+import os
+import sys
+import threading
+import types
+import weakref
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import contextmanager
+
+PRELOAD = ["guide.workloads", "guide.shm", "numpy", "pandas"]
+# Worker processes of each of the guide's pools, unless a pool asks for others.
+MAX_WORKERS = 2
+
+_context = None
+# Held while the real `__main__` is swapped out; re-entrant, so a block may start a pool that
+# starts processes of its own.
+_main_lock = threading.RLock()
+# Every pool not yet collected, with the thread that warms it up.
+_pools = weakref.WeakKeyDictionary()
+
+
+def preload() -> list[str]:
+    modules = os.environ.get("GUIDE_PRELOAD")
+    return [m.strip() for m in modules.split(",") if m.strip()] if modules is not None else PRELOAD
+
+
+def get_context():
+    """The multiprocessing context for every worker of the guide."""
+    global _context
+    if _context is None:
+        if "forkserver" in mp.get_all_start_methods():
+            context = mp.get_context("forkserver")
+            # Has to be set before the forkserver starts, which is when the first worker does.
+            context.set_forkserver_preload(preload())
+        else:
+            context = mp.get_context("spawn")
+        _context = context
+    return _context
+
+
+@contextmanager
+def detached_main():
+    """Start processes inside this block so they do not re-run the page script.
+
+    Swaps in an empty `__main__` for the duration; children then have no main module to restore.
+    `__main__` is process-wide, so blocks on different threads take turns: otherwise one could
+    restore the empty module that another put there. Streamlit's script runner does not take
+    turns: every run installs its script as `__main__` when it starts. If a run of another session
+    starts while a block is open, a process started after that in the block re-runs the script
+    once, in bare mode, before its first task, and the block leaves the run's module in place
+    rather than restore an older one. Blocks only last as long as starting a process, so this is
+    rare, and `main.py` runs without errors in bare mode, so it costs time rather than results.
+    """
+    with _main_lock:
+        main = sys.modules["__main__"]
+        detached = sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            yield
+        finally:
+            if sys.modules["__main__"] is detached:
+                sys.modules["__main__"] = main
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _warm(executor: ProcessPoolExecutor, max_workers: int):
+    with detached_main():
+        # The executor only starts a worker when none is idle, so submitting one task per worker
+        # at once starts all of them.
+        futures = [executor.submit(_ready) for _ in range(max_workers)]
+    wait(futures)
+
+
+def _shutdown_pools():
+    # A worker that is still starting when the interpreter exits finds the pool's queues gone and
+    # prints a traceback, so each pool finishes warming up first.
+    for executor, warmup in list(_pools.items()):
+        warmup.join()
+        executor.shutdown()
+
+
+def pool(max_workers: int, context=None) -> ProcessPoolExecutor:
+    """A ProcessPoolExecutor that starts all `max_workers` workers right away.
+
+    They start in the background (the first one also starts the forkserver, which takes as long
+    as importing PRELOAD), so creating the pool does not hold up the page that needs it first.
+    Shut the pool down when it is no longer needed; pools still open at exit are shut down then.
+    """
+    executor = ProcessPoolExecutor(max_workers, mp_context=context or get_context())
+    warmup = threading.Thread(target=_warm, args=(executor, max_workers), name="pool-warmup", daemon=True)
+    _pools[executor] = warmup
+    warmup.start()
+    return executor
+
+
+# Registered after concurrent.futures' own exit handler (imported above), so it runs before that
+# one, which refuses the warm-up's submissions; atexit would be too late.
+threading._register_atexit(_shutdown_pools)
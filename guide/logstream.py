@@ -0,0 +1,87 @@
+"""Subprocess output read by a background thread into a bounded buffer.
+
+Calling `proc.stdout.readline()` in the page script blocks the session until the worker prints a
+line. A LogStream reads in a thread of its own instead, so a rerun only takes the lines that arrived
+since it last looked and never waits. The buffer keeps at most `max_lines` lines and `max_chars`
+characters, dropping the oldest first, so a chatty long-running worker cannot grow memory.
+"""
+import subprocess
+import threading
+from collections import deque
+from itertools import islice
+
+import streamlit as st
+
+from guide import polling
+
+MAX_LINES = 10_000
+MAX_CHARS = 1024 * 1024
+# Lines kept on screen by tail().
+SHOW_LINES = 200
+
+
+class LogStream:
+    def __init__(self, args: list[str], max_lines: int = MAX_LINES, max_chars: int = MAX_CHARS, **popen_kwargs):
+        self.args = args
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.size = 0
+        self.dropped = 0
+        self._lines = deque()
+        self._next = 0
+        self._lock = threading.Lock()
+        # Undecodable output is replaced, not raised: an error here would close the pipe and kill the worker.
+        self._proc = subprocess.Popen(
+            args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1, **popen_kwargs
+        )
+        self._reader = threading.Thread(target=self._read, name=f"log-{self._proc.pid}", daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        with self._proc.stdout:
+            for line in self._proc.stdout:
+                line = line.rstrip("\n")[:self.max_chars]
+                with self._lock:
+                    self._lines.append(line)
+                    self._next += 1
+                    self.size += len(line)
+                    while len(self._lines) > self.max_lines or self.size > self.max_chars:
+                        self.size -= len(self._lines.popleft())
+                        self.dropped += 1
+
+    def read(self, cursor: int = 0) -> tuple[list[str], int]:
+        """The buffered lines numbered `cursor` and after, and the cursor for the next call.
+
+        Lines are numbered from 0 in output order; ones already dropped from the buffer are skipped.
+        """
+        with self._lock:
+            first = self._next - len(self._lines)
+            return list(islice(self._lines, max(cursor - first, 0), None)), self._next
+
+    @property
+    def returncode(self) -> int | None:
+        """The exit code, once the process has exited and all of its output has been read."""
+        if self._reader.is_alive():
+            return None
+        return self._proc.poll()
+
+    def stop(self):
+        self._proc.terminate()
+
+
+def _tail(stream: LogStream, key: str):
+    view = st.session_state.get(key)
+    if view is None or view["stream"] is not stream:
+        view = st.session_state[key] = {"stream": stream, "cursor": 0, "lines": deque(maxlen=SHOW_LINES)}
+    lines, view["cursor"] = stream.read(view["cursor"])
+    view["lines"].extend(lines)
+    st.code("\n".join(view["lines"]), language=None)
+
+
+def tail(stream: LogStream, key: str):
+    """Show the last SHOW_LINES lines of the stream, refreshed while it runs.
+
+    Each refresh takes only the lines added since the previous one; `key` holds this session's
+    place in the stream.
+    """
+    polling.poll(_tail, lambda: stream.returncode is None, stream, key)
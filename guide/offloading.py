@@ -0,0 +1,423 @@
+"""Live comparison of the three ways the tips page offloads work to another process.
+
+The same CPU-bound tasks (guide.workloads.task) are run through multiprocessing + Queue,
+ProcessPoolExecutor and subprocess, all cold-started with spawn, and through the warm forkserver
+pool of guide.launcher. For each strategy the page shows:
+- startup: from launching the workers until the first task starts
+- throughput: tasks completed per second
+- IPC: mean time from a worker finishing a task until its result is back in the app
+- memory: peak RSS per worker process (not available on Windows)
+"""
+import json
+import multiprocessing as mp
+import queue
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import streamlit as st
+
+from guide import batch, jobs, launcher, logstream, polling, scheduler, shm, workloads
+
+# The benchmark holds at most this many KB of results at once (result size × tasks), and a task's
+# result is dropped as soon as it has arrived.
+MAX_PAYLOAD_KB = 64 * 1024
+# Bounds of the scheduler demo's input, also for inputs taken from the URL.
+MIN_COMPUTE, MAX_COMPUTE = 1000, 10_000_000
+
+STRATEGIES = ["multiprocessing + Queue", "ProcessPoolExecutor", "subprocess", "warm pool (guide.launcher)"]
+
+_LABELS = {
+    "en": {
+        "title": "Offloading Benchmark",
+        "intro": "Runs the same CPU-bound tasks with each strategy from the Tips page and compares them.",
+        "workers": "Worker processes",
+        "tasks": "Tasks",
+        "size": "Work per task (count primes below)",
+        "payload": "Result size per task (KB)",
+        "run": "Run benchmark",
+        "running": "Running {}…",
+        "too_large": "Result size × tasks may be at most {:,} KB.",
+        "jobs": "Background jobs",
+        "jobs_intro": "Jobs run in worker processes shared by all sessions (two at a time); progress updates without rerunning the page.",
+        "start": "Start a job",
+        "logs": "Streaming worker logs",
+        "logs_intro": "A thread reads the worker's output into a bounded buffer; the page only picks up new lines and never waits for one.",
+        "launch": "Launch worker",
+        "stop": "Stop",
+        "exited": "The worker exited with code {}",
+        "scheduler": "Shared scheduler",
+        "scheduler_intro": (
+            "One process pool for all sessions: the same input is computed once, each session runs one task at a time,"
+            " and higher priorities go first."
+        ),
+        "priority": "Priority",
+        "compute": "Compute",
+        "quota": "Too many of your tasks are waiting. Try again when some have finished.",
+        "result": "Primes below {:,}: {:,}",
+        "shm": "Large results through shared memory",
+        "shm_intro": (
+            "The worker builds a DataFrame of random numbers and returns it pickled,"
+            " or in a shared memory segment that the app views without copying."
+        ),
+        "rows": "Rows",
+        "transfer": "Build and transfer",
+        "pickled": "Pickled (ms)",
+        "shared": "Shared memory (ms)",
+        "batch": "Streaming batch results",
+        "batch_intro": (
+            "Counts the primes below each of many inputs; inputs go to the shared scheduler in chunks, at low priority,"
+            " and each chunk shows up as soon as it is done."
+        ),
+        "inputs": "Inputs",
+        "run_batch": "Run batch",
+        "cancel": "Cancel",
+    },
+    "jp": {
+        "title": "別プロセス実行の比較",
+        "intro": "開発のコツで紹介した 3 つの方法で同じ CPU 負荷の処理を実行し、比較します。",
+        "workers": "ワーカープロセス数",
+        "tasks": "タスク数",
+        "size": "1 タスクの計算量 (この値未満の素数を数える)",
+        "payload": "1 タスクの結果サイズ (KB)",
+        "run": "ベンチマークを実行",
+        "running": "{} を実行中…",
+        "too_large": "結果サイズ × タスク数は {:,} KB までです。",
+        "jobs": "バックグラウンドジョブ",
+        "jobs_intro": (
+            "ジョブは全セッション共通のワーカープロセスで実行されます (同時に 2 つまで)。"
+            "進捗はページ全体を再実行せずに更新されます。"
+        ),
+        "start": "ジョブを開始",
+        "logs": "ワーカーのログを表示",
+        "logs_intro": (
+            "ワーカーの出力はスレッドが上限付きのバッファに読み込みます。"
+            "ページは新しい行だけを取り出し、出力を待つことはありません。"
+        ),
+        "launch": "ワーカーを起動",
+        "stop": "停止",
+        "exited": "ワーカーが終了しました (終了コード {})",
+        "scheduler": "共有スケジューラー",
+        "scheduler_intro": (
+            "全セッションで 1 つのプロセスプールを共有します。同じ入力は 1 回だけ計算され、"
+            "各セッションが同時に実行できるのは 1 タスクまでで、優先度の高いタスクから実行されます。"
+        ),
+        "priority": "優先度",
+        "compute": "計算",
+        "quota": "待機中のタスクが多すぎます。いくつか終わってからもう一度お試しください。",
+        "result": "{:,} 未満の素数: {:,} 個",
+        "shm": "共有メモリで大きな結果を受け取る",
+        "shm_intro": (
+            "ワーカーが乱数の DataFrame を作り、pickle で返す場合と、"
+            "アプリがコピーせずに参照する共有メモリで返す場合を比べます。"
+        ),
+        "rows": "行数",
+        "transfer": "作成して受け取る",
+        "pickled": "pickle (ms)",
+        "shared": "共有メモリ (ms)",
+        "batch": "バッチ結果を順次表示",
+        "batch_intro": (
+            "多数の入力それぞれについて、その値未満の素数を数えます。"
+            "入力はまとめて低い優先度で共有スケジューラーに送られ、終わったまとまりから表示されます。"
+        ),
+        "inputs": "入力の数",
+        "run_batch": "バッチを実行",
+        "cancel": "中止",
+    },
+}
+
+
+def _summarize(strategy: str, launched: float, records: list[dict]) -> dict:
+    done = max(r["received"] for r in records)
+    rss = {r["pid"]: r["rss_kb"] for r in records if r["rss_kb"] is not None}
+    return {
+        "strategy": strategy,
+        "startup_ms": (min(r["started"] for r in records) - launched) * 1000,
+        "throughput_per_s": len(records) / (done - launched),
+        "ipc_ms": statistics.mean(r["received"] - r["finished"] for r in records) * 1000,
+        "memory_mb": statistics.mean(rss.values()) / 1024 if rss else None,
+    }
+
+
+def run_queue(workers: int, tasks: int, n: int, payload_kb: int) -> dict:
+    ctx = mp.get_context("spawn")
+    task_q, result_q = ctx.Queue(), ctx.Queue()
+    launched = time.time()
+    procs = [ctx.Process(target=workloads.queue_worker, args=(task_q, result_q), daemon=True) for _ in range(workers)]
+    with launcher.detached_main():
+        for p in procs:
+            p.start()
+    for _ in range(tasks):
+        task_q.put((n, payload_kb))
+    for _ in procs:
+        task_q.put(None)
+    records = []
+    while len(records) < tasks:
+        try:
+            record = result_q.get(timeout=1)
+        except queue.Empty:
+            # A worker that dies never answers; don't wait for it forever.
+            if not any(p.is_alive() for p in procs):
+                raise RuntimeError("multiprocessing workers exited before finishing their tasks")
+            continue
+        record["received"] = time.time()
+        del record["payload"]
+        records.append(record)
+    for p in procs:
+        p.join()
+    return _summarize(STRATEGIES[0], launched, records)
+
+
+def _collect(strategy: str, executor: ProcessPoolExecutor, tasks: int, n: int, payload_kb: int) -> dict:
+    launched = time.time()
+    records = []
+    with launcher.detached_main():
+        futures = [executor.submit(workloads.task, n, payload_kb) for _ in range(tasks)]
+    for future in as_completed(futures):
+        # The future holds this same dict, so deleting the payload frees it.
+        record = future.result()
+        record["received"] = time.time()
+        del record["payload"]
+        records.append(record)
+    return _summarize(strategy, launched, records)
+
+
+def run_pool(workers: int, tasks: int, n: int, payload_kb: int) -> dict:
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as executor:
+        return _collect(STRATEGIES[1], executor, tasks, n, payload_kb)
+
+
+class _WarmPool:
+    """The benchmark's one warm pool, replaced when a run asks for another number of workers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._workers = 0
+
+    def get(self, workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            if workers != self._workers:
+                if self._executor is not None:
+                    # Tasks already submitted still finish; then its workers exit.
+                    self._executor.shutdown(wait=False)
+                self._executor, self._workers = launcher.pool(workers), workers
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor, self._workers = None, 0
+
+
+@st.cache_resource(show_spinner=False, on_release=_WarmPool.shutdown)
+def _warm_pool() -> _WarmPool:
+    return _WarmPool()
+
+
+def run_warm_pool(workers: int, tasks: int, n: int, payload_kb: int) -> dict:
+    return _collect(STRATEGIES[3], _warm_pool().get(workers), tasks, n, payload_kb)
+
+
+def run_subprocess(workers: int, tasks: int, n: int, payload_kb: int) -> dict:
+    launched = time.time()
+    records = []
+
+    def read(proc: subprocess.Popen):
+        # One reader per worker, so a full pipe of one worker never delays another's results.
+        for line in proc.stdout:
+            record = json.loads(line)
+            record["received"] = time.time()
+            del record["payload"]
+            records.append(record)
+
+    shares = [tasks // workers + (i < tasks % workers) for i in range(workers)]
+    procs = [
+        subprocess.Popen([sys.executable, "-m", "guide.workloads", str(n), str(payload_kb), str(share)], stdout=subprocess.PIPE, text=True)
+        for share in shares if share
+    ]
+    readers = [threading.Thread(target=read, args=(proc,)) for proc in procs]
+    for reader in readers:
+        reader.start()
+    for reader, proc in zip(readers, procs):
+        reader.join()
+        if proc.wait():
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+    return _summarize(STRATEGIES[2], launched, records)
+
+
+@st.fragment
+def _benchmark(lang: str):
+    text = _LABELS[lang]
+    col1, col2 = st.columns(2)
+    workers = col1.number_input(text["workers"], 1, 8, 2)
+    tasks = col2.number_input(text["tasks"], 1, 200, 16)
+    n = col1.number_input(text["size"], 1000, 1_000_000, 20_000, step=1000)
+    payload_kb = col2.number_input(text["payload"], 0, MAX_PAYLOAD_KB, 64)
+    too_large = payload_kb * tasks > MAX_PAYLOAD_KB
+    if too_large:
+        st.warning(text["too_large"].format(MAX_PAYLOAD_KB))
+
+    if st.button(text["run"], type="primary", disabled=too_large):
+        results = []
+        for strategy, run in zip(STRATEGIES, [run_queue, run_pool, run_subprocess, run_warm_pool]):
+            with st.spinner(text["running"].format(strategy)):
+                results.append(run(workers, tasks, n, payload_kb))
+        st.session_state["offloading_results"] = results
+
+    results = st.session_state.get("offloading_results")
+    if not results:
+        return
+    import pandas as pd
+
+    df = pd.DataFrame(results).set_index("strategy")
+    st.dataframe(df.style.format("{:.1f}", na_rep="-"))
+    columns = st.columns(2)
+    for i, metric in enumerate(df.columns):
+        with columns[i % 2]:
+            st.caption(metric)
+            st.bar_chart(df[metric], horizontal=True)
+
+
+def _computing() -> bool:
+    return any(not future.done() for _, future in st.session_state.get("computations", []))
+
+
+def _resubmit(calcs: list[str]) -> list:
+    """The computations of a reloaded tab, from its `calc` query parameters.
+
+    Submitting one again reattaches to it: the scheduler shares a running call and keeps finished
+    results, so only one that has since left its LRU (or a server restart) is computed again.
+    """
+    computations = []
+    for n in calcs:
+        if not n.isdigit() or not MIN_COMPUTE <= int(n) <= MAX_COMPUTE:
+            # Only what the form could have asked for.
+            continue
+        try:
+            computations.append((int(n), scheduler.get_scheduler().submit(workloads.count_primes, int(n))))
+        except scheduler.QuotaExceeded:
+            break
+    return computations
+
+
+def _computations(lang: str):
+    text = _LABELS[lang]
+    computations = st.session_state.get("computations", [])
+    if not computations:
+        # Nothing submitted yet: the scheduler, and with it its pool, is not started just for the numbers.
+        return
+    stats = scheduler.get_scheduler().stats()
+    columns = st.columns(4)
+    columns[0].metric("queued", sum(stats["queued"].values()))
+    columns[1].metric("running", stats["running"])
+    columns[2].metric("cache hits", stats["cache_hits"])
+    columns[3].metric("shared", stats["shared"])
+    for n, future in reversed(computations):
+        if not future.done():
+            st.caption(f"{n:,}: …")
+        elif future.exception() is None:
+            st.write(text["result"].format(n, future.result()))
+        else:
+            st.error(future.exception())
+
+
+def _batch_chart(results):
+    import pandas as pd
+
+    inputs = st.session_state["batch_inputs"]
+    st.scatter_chart(pd.DataFrame({"n": results["index"].map(inputs.__getitem__), "primes": results["value"]}), x="n", y="primes")
+
+
+def show(lang: str):
+    text = _LABELS[lang]
+    st.set_page_config(page_title=text["title"])
+    st.title(text["title"])
+    st.markdown(text["intro"])
+    _benchmark(lang)
+
+    st.subheader(text["jobs"], divider=True)
+    st.markdown(text["jobs_intro"])
+    if "jobs" not in st.session_state:
+        # A reloaded tab gets its jobs back from the URL.
+        st.session_state["jobs"] = st.query_params.get_all("job")
+    n = st.number_input(text["size"], 1000, 10_000_000, 1_000_000, step=100_000, key="job-n")
+    if st.button(text["start"]):
+        st.session_state["jobs"].append(jobs.get_manager().submit(workloads.sweep, n))
+    if st.session_state["jobs"] and st.query_params.get_all("job") != st.session_state["jobs"]:
+        st.query_params["job"] = st.session_state["jobs"]
+    jobs.watch(st.session_state["jobs"], lang)
+
+    st.subheader(text["logs"], divider=True)
+    st.markdown(text["logs_intro"])
+    stream = st.session_state.get("log_stream")
+    running = stream is not None and stream.returncode is None
+    if st.button(text["stop"] if running else text["launch"]):
+        if running:
+            stream.stop()
+        else:
+            st.session_state["log_stream"] = logstream.LogStream([sys.executable, "-m", "guide.workloads", "100000", "0", "50"])
+        st.rerun()
+    if stream is not None:
+        logstream.tail(stream, "log-view")
+        if stream.returncode is not None:
+            (st.success if stream.returncode == 0 else st.error)(text["exited"].format(stream.returncode))
+
+    st.subheader(text["scheduler"], divider=True)
+    st.markdown(text["scheduler_intro"])
+    col1, col2 = st.columns(2)
+    n = col1.number_input(text["size"], MIN_COMPUTE, MAX_COMPUTE, 500_000, step=100_000, key="scheduler-n")
+    priority = col2.segmented_control(text["priority"], scheduler.LANES, default=scheduler.NORMAL, key="scheduler-priority")
+    if "computations" not in st.session_state:
+        st.session_state["computations"] = _resubmit(st.query_params.get_all("calc"))
+    if st.button(text["compute"]):
+        try:
+            future = scheduler.get_scheduler().submit(workloads.count_primes, n, priority=priority or scheduler.NORMAL)
+            st.session_state["computations"].append((n, future))
+        except scheduler.QuotaExceeded:
+            st.warning(text["quota"])
+    calcs = [str(n) for n, _ in st.session_state["computations"]]
+    if calcs and st.query_params.get_all("calc") != calcs:
+        st.query_params["calc"] = calcs
+    polling.poll(_computations, _computing, lang)
+
+    st.subheader(text["shm"], divider=True)
+    st.markdown(text["shm_intro"])
+    rows = st.number_input(text["rows"], 100_000, 20_000_000, 2_000_000, step=1_000_000, key="shm-rows")
+    if st.button(text["transfer"]):
+        pool = scheduler.get_scheduler()
+        timings = {}
+        with st.spinner():
+            for shared in (False, True):
+                start = time.perf_counter()
+                result = pool.submit(workloads.random_frame, rows, shared=shared, priority=scheduler.HIGH, dedupe=False).result()
+                if shared:
+                    # Replacing the previous result releases its segment.
+                    st.session_state["shm_result"] = shm.attach(result)
+                timings[shared] = (time.perf_counter() - start) * 1000
+        st.session_state["shm_timings"] = timings
+    if "shm_timings" in st.session_state:
+        timings = st.session_state["shm_timings"]
+        col1, col2 = st.columns(2)
+        col1.metric(text["pickled"], f"{timings[False]:,.0f}")
+        col2.metric(text["shared"], f"{timings[True]:,.0f}")
+        st.dataframe(st.session_state["shm_result"].value.describe())
+
+    st.subheader(text["batch"], divider=True)
+    st.markdown(text["batch_intro"])
+    count = st.number_input(text["inputs"], 10, batch.MAX_INPUTS, 1000, step=100, key="batch-count")
+    current = st.session_state.get("batch")
+    col1, col2 = st.columns(2)
+    if col1.button(text["run_batch"]):
+        if current is not None:
+            current.cancel()
+        inputs = st.session_state["batch_inputs"] = [1000 + 5 * i for i in range(count)]
+        current = st.session_state["batch"] = batch.BatchMap(scheduler.get_scheduler(), workloads.count_primes, inputs)
+    if current is not None and not current.done and col2.button(text["cancel"]):
+        current.cancel()
+    if current is not None:
+        batch.stream(current, "batch-view", _batch_chart)
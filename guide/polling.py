@@ -0,0 +1,23 @@
+"""Fragments that refresh themselves while work runs elsewhere.
+
+    polling.poll(_show_jobs, lambda: any(not job.done for job in jobs), jobs)
+
+`_show_jobs(jobs)` runs in a fragment that reruns every POLL_INTERVAL while the work is active, and
+not at all once it is finished, so polling never reruns the whole page.
+"""
+import streamlit as st
+
+POLL_INTERVAL = 0.5
+
+
+def _poll(render, active, polling: bool, args: tuple):
+    render(*args)
+    if polling and not active():
+        # Finished: one full rerun lets the page show the outcome and stops the polling.
+        st.rerun()
+
+
+def poll(render, active, *args):
+    """Call `render(*args)` in a fragment, rerun every POLL_INTERVAL as long as `active()` is true."""
+    polling = active()
+    st.fragment(_poll, run_every=POLL_INTERVAL if polling else None)(render, active, polling, args)
@@ -0,0 +1,183 @@
+"""Opt-in profiling of a page rerun: the page script, each `st.*` call and each delta sent.
+
+`GUIDE_PROFILE=1` in the environment profiles every rerun. With `GUIDE_PROFILE=allow`, only
+reruns with `?profile=1` in the URL are profiled; without either, the query parameter does
+nothing, so visitors cannot switch profiling on. Each profiled rerun is shown in a panel at the
+bottom of the page and appended as one JSON line to `build/profile.jsonl` (or the file named by
+`GUIDE_PROFILE_LOG`). Once the log is over LOG_LIMIT bytes it is moved to `<name>.1`, replacing
+the previous one, and a new log is started.
+
+While any rerun is profiled, the `st.*` functions and the DeltaGenerator methods (`st.sidebar.*`,
+columns, containers) are wrapped to time themselves. The wrappers are process-wide but only record
+in the thread of a profiled rerun; other sessions go straight through them.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+LOG_PATH = "build/profile.jsonl"
+LOG_LIMIT = 16 * 1024 * 1024
+
+# `st` functions that send nothing themselves or only return a decorator.
+_UNTIMED = {"get_option", "set_option", "connection", "fragment", "dialog", "echo"}
+
+_active = ContextVar("profiler", default=None)
+
+_wrap_lock = threading.Lock()
+_profiling = 0
+_originals = []
+
+
+def enabled() -> bool:
+    setting = os.environ.get("GUIDE_PROFILE")
+    return setting == "1" or (setting == "allow" and st.query_params.get("profile") == "1")
+
+
+def _message_type(msg) -> str:
+    kind = msg.WhichOneof("type")
+    if kind != "delta":
+        return kind
+    delta = msg.delta.WhichOneof("type")
+    if delta == "new_element":
+        return msg.delta.new_element.WhichOneof("type")
+    return delta
+
+
+def _timed(name: str, fn):
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        profiler = _active.get()
+        # Calls made by another call are part of its time, not calls of their own.
+        if profiler is None or profiler._call is not None:
+            return fn(*args, **kwargs)
+        with call(name):
+            return fn(*args, **kwargs)
+    return timed
+
+
+def _wrap():
+    global _profiling
+    with _wrap_lock:
+        _profiling += 1
+        if _profiling > 1:
+            return
+        for name in dir(DeltaGenerator):
+            fn = getattr(DeltaGenerator, name)
+            if not name.startswith("_") and isinstance(fn, types.FunctionType):
+                _originals.append((DeltaGenerator, name, DeltaGenerator.__dict__.get(name)))
+                setattr(DeltaGenerator, name, _timed(name, fn))
+        # `st.markdown` and the like are methods bound to the main DeltaGenerator at import time,
+        # so they are wrapped where they are, not through the class.
+        for name, fn in list(vars(st).items()):
+            if not name.startswith("_") and name not in _UNTIMED and isinstance(fn, (types.FunctionType, types.MethodType)):
+                _originals.append((st, name, fn))
+                setattr(st, name, _timed(name, fn))
+
+
+def _unwrap():
+    global _profiling
+    with _wrap_lock:
+        _profiling -= 1
+        if _profiling:
+            return
+        for owner, name, original in reversed(_originals):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        _originals.clear()
+
+
+class Profiler:
+    def __init__(self, page: str | None = None):
+        self.page = page
+        self.script_ms = 0.0
+        self.calls = []
+        self.deltas = []
+        self._start = 0.0
+        self._call = None
+
+    def _elapsed(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+
+    @contextmanager
+    def run(self):
+        """Profile the page script run inside this block."""
+        ctx = get_script_run_ctx()
+        enqueue = ctx._enqueue
+
+        def record(msg):
+            self.deltas.append({
+                "type": _message_type(msg),
+                "bytes": msg.ByteSize(),
+                "at_ms": round(self._elapsed(), 3),
+                "call": self._call,
+            })
+            enqueue(msg)
+
+        ctx._enqueue = record
+        token = _active.set(self)
+        _wrap()
+        self._start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.script_ms = self._elapsed()
+            _unwrap()
+            _active.reset(token)
+            ctx._enqueue = enqueue
+
+    def summary(self) -> dict:
+        return {
+            "time": time.time(),
+            "page": self.page,
+            "script_ms": round(self.script_ms, 3),
+            "delta_count": len(self.deltas),
+            "delta_bytes": sum(d["bytes"] for d in self.deltas),
+            "calls": self.calls,
+            "deltas": self.deltas,
+        }
+
+    def save(self):
+        path = Path(os.environ.get("GUIDE_PROFILE_LOG", LOG_PATH))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.is_file() and path.stat().st_size > LOG_LIMIT:
+            path.replace(path.with_name(path.name + ".1"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.summary(), ensure_ascii=False) + "\n")
+
+    def panel(self):
+        summary = self.summary()
+        with st.expander(f"Profile: {summary['script_ms']:.1f} ms, {summary['delta_count']} deltas, {summary['delta_bytes']} bytes"):
+            st.markdown("**`st.*` calls**")
+            st.dataframe(self.calls)
+            st.markdown("**Deltas**")
+            st.dataframe(self.deltas)
+
+
+@contextmanager
+def call(name: str):
+    """Time one `st.*` call; deltas sent meanwhile are attributed to it. A no-op unless profiling."""
+    profiler = _active.get()
+    if profiler is None:
+        yield
+        return
+    index, parent = len(profiler.calls), profiler._call
+    profiler.calls.append({"call": name, "ms": 0.0})
+    profiler._call = index
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.calls[index]["ms"] = round((time.perf_counter() - start) * 1000, 3)
+        profiler._call = parent
@@ -0,0 +1,73 @@
+"""The guide's pages.
+
+A page has the same URL path, and so the same identity for `st.navigation`, in every language.
+Switching language keeps the reader on the current page; only the title and content change.
+"""
+import importlib
+from functools import partial
+
+import streamlit as st
+
+from guide.content import LANGUAGES, render, toc
+
+DEFAULT_LANGUAGE = "jp"
+
+# Primary subtags of Accept-Language mapped to the guide's languages.
+_LANGUAGE_TAGS = {"en": "en", "ja": "jp"}
+
+PAGES = {
+    "introduction": {"icon": ":material/home:", "title": {"en": "Introduction", "jp": "はじめに"}},
+    "handson": {"icon": ":material/build:", "title": {"en": "Hands-on", "jp": "作ってみよう"}},
+    "tips": {"icon": ":material/lightbulb_2:", "title": {"en": "Tips", "jp": "開発のコツ"}},
+    # Pages with a `view` ("module:function") are interactive and have no content source. The module
+    # is imported when the page is first shown, so its imports never slow down the other pages.
+    "offloading": {
+        "icon": ":material/speed:",
+        "title": {"en": "Offloading Benchmark", "jp": "別プロセス実行の比較"},
+        "view": "guide.offloading:show",
+    },
+}
+
+
+def _show(name: str, lang: str, one_section: bool):
+    if "view" in PAGES[name]:
+        module, _, function = PAGES[name]["view"].partition(":")
+        getattr(importlib.import_module(module), function)(lang)
+        return
+    if not one_section:
+        render(name, lang)
+        return
+    # Reading mode: a table of contents in the sidebar and only the chosen section on the page.
+    headings = dict(toc(name, lang))
+    section_id = st.sidebar.radio("目次" if lang == "jp" else "Contents", list(headings), format_func=headings.get, key=f"toc-{name}")
+    render(name, lang, section_id)
+
+
+def build(lang: str, one_section: bool = False) -> dict[str, st.Page]:
+    return {
+        name: st.Page(partial(_show, name, lang, one_section), title=page["title"][lang], icon=page["icon"], url_path=name)
+        for name, page in PAGES.items()
+    }
+
+
+def detect_language(accept_language: str) -> str:
+    """Return the guide language the browser prefers most, e.g. "ja,en-US;q=0.8" -> "jp"."""
+    best, best_q = DEFAULT_LANGUAGE, 0.0
+    for item in accept_language.split(","):
+        tag, _, params = item.partition(";")
+        lang = _LANGUAGE_TAGS.get(tag.strip().lower().split("-")[0])
+        try:
+            q = float(params.strip()[2:]) if params.strip().startswith("q=") else 1.0
+        except ValueError:
+            continue
+        if lang and q > best_q:
+            best, best_q = lang, q
+    return best
+
+
+def initial_language() -> str:
+    """The language of a new session: the `lang` query parameter, else the browser's preference."""
+    lang = st.query_params.get("lang", "").lower()
+    if lang in LANGUAGES:
+        return lang
+    return detect_language(st.context.headers.get("Accept-Language", ""))
@@ -0,0 +1,190 @@
+"""A warm process pool (guide.launcher) shared by every session, with deduplication, quotas and priorities.
+
+`submit(fn, *args, session=..., priority=...)` returns a `concurrent.futures.Future`, like the
+executor's own, but:
+- calls with the same function and arguments share one Future while running, and completed
+  results are kept in an LRU, so a repeated submission costs nothing;
+- tasks wait in one lane per priority and are handed to the pool only when a worker is free,
+  highest lane first;
+- a session runs at most `per_session` tasks at once (the rest wait their turn in the lane, so one
+  session cannot occupy the whole pool) and may have at most `max_queued` waiting. A task may
+  raise that limit for itself, as guide.batch does for the chunks of a batch.
+`stats()` reports queue depth per lane and the hit counters.
+"""
+import hashlib
+import pickle
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from guide import launcher
+
+HIGH, NORMAL, LOW = "high", "normal", "low"
+LANES = [HIGH, NORMAL, LOW]
+
+PER_SESSION = 1
+MAX_QUEUED = 8
+CACHE_SIZE = 256
+
+
+class QuotaExceeded(RuntimeError):
+    pass
+
+
+def _key(fn, args: tuple, kwargs: dict) -> str:
+    data = pickle.dumps((fn.__module__, fn.__qualname__, args, sorted(kwargs.items())))
+    return hashlib.sha256(data).hexdigest()
+
+
+def session_id() -> str:
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else ""
+
+
+class Scheduler:
+    def __init__(
+        self, max_workers: int = launcher.MAX_WORKERS, per_session: int = PER_SESSION, max_queued: int = MAX_QUEUED,
+        cache_size: int = CACHE_SIZE, context=None,
+    ):
+        self.max_workers = max_workers
+        self.per_session = per_session
+        self.max_queued = max_queued
+        self.cache_size = cache_size
+        self.counters = {"submitted": 0, "cache_hits": 0, "shared": 0, "failed": 0}
+        self._context = context
+        self._executor = launcher.pool(max_workers, context)
+        self._lanes = {lane: deque() for lane in LANES}
+        self._inflight = {}
+        self._results = OrderedDict()
+        self._running = {}
+        self._changed = threading.Condition()
+        self._closed = False
+        self._dispatcher = threading.Thread(target=self._dispatch, name="scheduler", daemon=True)
+        self._dispatcher.start()
+
+    def submit(
+        self, fn, *args, session: str | None = None, priority: str = NORMAL, dedupe: bool = True, per_session: int | None = None,
+        **kwargs,
+    ) -> Future:
+        """Schedule `fn(*args, **kwargs)` for `session` (the current one by default).
+
+        With `dedupe=False` the call is never shared or cached, for results that belong to one
+        caller, such as shared memory handles. `per_session` overrides the scheduler's limit for
+        this task: it starts while the session runs fewer tasks than that. Raises QuotaExceeded if
+        the session already has `max_queued` tasks waiting, and ValueError for a priority not in LANES.
+        """
+        if priority not in LANES:
+            raise ValueError(f"unknown priority {priority!r}, expected one of {LANES}")
+        key = _key(fn, args, kwargs) if dedupe else f"private-{uuid.uuid4().hex}"
+        session = session_id() if session is None else session
+        with self._changed:
+            if self._closed:
+                raise RuntimeError("the scheduler has been shut down")
+            self.counters["submitted"] += 1
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.counters["cache_hits"] += 1
+                return self._results[key]
+            if key in self._inflight:
+                self.counters["shared"] += 1
+                return self._inflight[key]
+            if sum(task[1] == session for lane in self._lanes.values() for task in lane) >= self.max_queued:
+                raise QuotaExceeded(f"{self.max_queued} tasks are already waiting for this session")
+            future = self._inflight[key] = Future()
+            self._lanes[priority].append((key, session, per_session or self.per_session, fn, args, kwargs))
+            self._changed.notify()
+        return future
+
+    def stats(self) -> dict:
+        with self._changed:
+            return {
+                "queued": {lane: len(tasks) for lane, tasks in self._lanes.items()},
+                "running": sum(self._running.values()),
+                "cached": len(self._results),
+                **self.counters,
+            }
+
+    def shutdown(self):
+        """Cancel the waiting tasks and shut the pool down; running tasks still finish."""
+        with self._changed:
+            self._closed = True
+            waiting = [task for lane in self._lanes.values() for task in lane]
+            for tasks in self._lanes.values():
+                tasks.clear()
+            for key, *_ in waiting:
+                self._inflight.pop(key).cancel()
+            self._changed.notify()
+        # The dispatcher may be handing a task to the pool; those are running, or about to on a
+        # worker that is still starting.
+        self._dispatcher.join()
+        self._executor.shutdown(wait=False)
+
+    def _next(self):
+        """The first waiting task of the highest lane whose session is under its quota, if any."""
+        if sum(self._running.values()) >= self.max_workers:
+            return None
+        for tasks in self._lanes.values():
+            for task in tasks:
+                if self._running.get(task[1], 0) < task[2]:
+                    tasks.remove(task)
+                    return task
+        return None
+
+    def _submit(self, fn, args: tuple, kwargs: dict) -> Future:
+        # Submitting starts a worker if none is idle yet, for example while a new pool warms up.
+        with launcher.detached_main():
+            try:
+                return self._executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # A worker died (killed, crashed, os._exit) and took the pool with it; the tasks it was
+                # running have already failed. Later tasks get a new pool.
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = launcher.pool(self.max_workers, self._context)
+                return self._executor.submit(fn, *args, **kwargs)
+
+    def _dispatch(self):
+        while True:
+            with self._changed:
+                while (task := self._next()) is None:
+                    if self._closed:
+                        return
+                    self._changed.wait()
+                key, session, _, fn, args, kwargs = task
+                self._running[session] = self._running.get(session, 0) + 1
+            # All submitting happens on this thread, so only it replaces the pool; the pool's
+            # callbacks only record the outcome.
+            try:
+                done = self._submit(fn, args, kwargs)
+            except Exception as e:
+                done = Future()
+                done.set_exception(e)
+            done.add_done_callback(lambda done, key=key, session=session: self._finish(key, session, done))
+
+    def _finish(self, key: str, session: str, done: Future):
+        with self._changed:
+            self._running[session] -= 1
+            if not self._running[session]:
+                del self._running[session]
+            future = self._inflight.pop(key)
+            if done.exception() is not None:
+                self.counters["failed"] += 1
+            elif not key.startswith("private-"):
+                self._results[key] = future
+                if len(self._results) > self.cache_size:
+                    self._results.popitem(last=False)
+            self._changed.notify()
+        # Outside the lock: the Future's own callbacks may call back into the scheduler.
+        if done.exception() is None:
+            future.set_result(done.result())
+        else:
+            future.set_exception(done.exception())
+
+
+@st.cache_resource(show_spinner=False, on_release=Scheduler.shutdown)
+def get_scheduler() -> Scheduler:
+    return Scheduler()
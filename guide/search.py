@@ -0,0 +1,70 @@
+"""Full-text search over the sections of every page in both languages.
+
+English text is indexed by words. Japanese has no spaces between words, so Japanese runs are
+indexed by character bigrams (and single characters, for one-character queries); words written
+in Latin letters inside Japanese pages are still indexed as words.
+"""
+import re
+from collections import Counter, defaultdict
+
+import streamlit as st
+
+from guide import content
+
+_WORD = re.compile(r"[0-9a-z]+")
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uff66-\uff9f]+")
+
+
+def terms(text: str, lang: str, query: bool = False) -> list[str]:
+    text = text.lower()
+    tokens = _WORD.findall(text)
+    if lang == "jp":
+        for run in _CJK.findall(text):
+            if len(run) == 1 or not query:
+                tokens.extend(run)
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _text(nodes: list) -> list[str]:
+    parts = []
+    for name, args, kwargs, children in nodes:
+        if name in ("markdown", "warning", "caption", "expander"):
+            parts.append(args[0])
+        parts.extend(_text(children))
+    return parts
+
+
+class Index:
+    def __init__(self):
+        # A document is one section: (lang, page, section id, heading).
+        self.docs = []
+        self.postings = defaultdict(dict)
+
+    def add(self, lang: str, page: str, section: dict, title: str):
+        doc = len(self.docs)
+        heading = section["heading"] or title
+        self.docs.append((lang, page, section["id"], heading))
+        text = "\n".join([heading, *_text(section["nodes"])])
+        for term, count in Counter(terms(text, lang)).items():
+            self.postings[term][doc] = count
+
+    def search(self, query: str, lang: str, limit: int = 8) -> list[tuple]:
+        """Return the sections in `lang` that contain every term of `query`, best match first."""
+        query_terms = set(terms(query, lang, query=True))
+        if not query_terms:
+            return []
+        postings = sorted((self.postings.get(term, {}) for term in query_terms), key=len)
+        hits = [doc for doc in postings[0] if self.docs[doc][0] == lang and all(doc in p for p in postings[1:])]
+        hits.sort(key=lambda doc: -sum(p[doc] for p in postings))
+        return [self.docs[doc] for doc in hits[:limit]]
+
+
+@st.cache_resource(show_spinner=False)
+def get_index() -> Index:
+    index = Index()
+    for lang in content.LANGUAGES:
+        for page, data in content.load_bundle(lang)["pages"].items():
+            for section in data["sections"]:
+                index.add(lang, page, section, data["title"])
+    return index
@@ -0,0 +1,166 @@
+"""Large results handed from worker processes to the app through shared memory.
+
+Returning a NumPy array or DataFrame from a worker pickles it, copies it through a pipe and
+unpickles it again, so the app briefly holds it twice. Instead the worker calls `export()`,
+which writes the data into one named shared memory segment and returns a small handle, and the app
+calls `attach()` on the handle and gets an array or DataFrame that views the segment in place:
+
+    def job(rows):                        # in the worker
+        return shm.export(build_frame(rows))
+
+    result = shm.attach(future.result())  # in the app
+    st.dataframe(result.value)
+
+The segment is unlinked when the SharedResult is garbage collected, for example when it is
+replaced in `st.session_state` or the session ends, or earlier with `release()`. Views still in use
+stay valid; the memory is freed when the last one is dropped.
+
+Only numeric data can be shared: arrays of a numeric dtype, and DataFrames whose columns all are
+numeric and whose index is a RangeIndex.
+
+`Counters` is the other direction: a few float slots, such as progress, that workers write and the
+app reads in place, with no message per update. This module does not import Streamlit, so workers
+can import it cheaply.
+"""
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Column offsets in a segment are aligned to this many bytes.
+ALIGN = 64
+
+
+def _aligned(n: int) -> int:
+    return -(-n // ALIGN) * ALIGN
+
+
+def _check(dtype: np.dtype):
+    if dtype.kind not in "biuf":
+        raise ValueError(f"only numeric data can be shared, not {dtype}")
+
+
+def export(value) -> dict:
+    """Copy an array or a numeric DataFrame into a new shared memory segment and return its handle.
+
+    The caller (normally a worker process) closes its own mapping; the segment lives on until the
+    app releases it.
+    """
+    if isinstance(value, np.ndarray):
+        _check(value.dtype)
+        arrays, handle = [value], {"kind": "array", "shape": value.shape, "dtype": value.dtype.str}
+    else:
+        import pandas as pd
+
+        if not isinstance(value.index, pd.RangeIndex):
+            raise ValueError("only DataFrames with a RangeIndex can be shared; call reset_index() first")
+        arrays = [value[column].to_numpy() for column in value.columns]
+        for array in arrays:
+            _check(array.dtype)
+        index = value.index
+        handle = {
+            "kind": "frame",
+            "columns": list(value.columns),
+            "dtypes": [array.dtype.str for array in arrays],
+            "rows": len(value),
+            "index": (index.start, index.stop, index.step),
+        }
+    offsets, size = [], 0
+    for array in arrays:
+        offsets.append(size)
+        size += _aligned(array.nbytes)
+    segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        for array, offset in zip(arrays, offsets):
+            np.ndarray(array.shape, array.dtype, buffer=segment.buf, offset=offset)[...] = array
+    except BaseException:
+        segment.close()
+        segment.unlink()
+        raise
+    segment.close()
+    return {**handle, "name": segment.name, "offsets": offsets}
+
+
+def _unlink(segment: shared_memory.SharedMemory):
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class _Mapped(np.ndarray):
+    """The bytes of a segment. Views of it keep the segment, and so its mapping, alive.
+
+    NumPy holds no buffer export on the mapping it views, so a mapping closed under a view would
+    leave it dangling; an ndarray subclass is where a view's base chain stops, so it can hold it.
+    """
+    segment = None
+
+
+class SharedResult:
+    def __init__(self, handle: dict):
+        self.handle = handle
+        self._segment = shared_memory.SharedMemory(name=handle["name"])
+        self._finalizer = weakref.finalize(self, _unlink, self._segment)
+        mapped = np.ndarray((self._segment.size,), np.uint8, buffer=self._segment.buf).view(_Mapped)
+        mapped.segment = self._segment
+
+        def view(dtype: str, shape: tuple, offset: int) -> np.ndarray:
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape))
+            return mapped[offset:offset + count * dtype.itemsize].view(np.ndarray).view(dtype).reshape(shape)
+
+        if handle["kind"] == "array":
+            self.value = view(handle["dtype"], handle["shape"], handle["offsets"][0])
+        else:
+            import pandas as pd
+
+            columns = {
+                column: view(dtype, (handle["rows"],), offset)
+                for column, dtype, offset in zip(handle["columns"], handle["dtypes"], handle["offsets"])
+            }
+            self.value = pd.DataFrame(columns, index=pd.RangeIndex(*handle["index"]), copy=False)
+
+    @property
+    def nbytes(self) -> int:
+        return self._segment.size
+
+    def release(self):
+        """Unlink the segment now instead of when this object is collected."""
+        self.value = None
+        self._finalizer()
+
+
+def attach(handle: dict) -> SharedResult:
+    return SharedResult(handle)
+
+
+class Counters:
+    """`size` float slots in a shared memory segment, all 0.0 at first.
+
+    The app creates them (`Counters(size)`) and hands `name` to workers, which open them with
+    `Counters(name=name)`. Slots are read and written in place; a single slot is always written
+    whole, so readers never see half an update.
+    """
+
+    def __init__(self, size: int = 0, name: str | None = None):
+        self._owner = name is None
+        self._segment = shared_memory.SharedMemory(name=name, create=self._owner, size=size * 8)
+        self.name = self._segment.name
+        self._slots = self._segment.buf.cast("d")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __getitem__(self, slot: int) -> float:
+        return self._slots[slot]
+
+    def __setitem__(self, slot: int, value: float):
+        self._slots[slot] = value
+
+    def close(self):
+        """Close this process's mapping, and in the process that created the segment also unlink it."""
+        self._slots.release()
+        self._segment.close()
+        if self._owner:
+            _unlink(self._segment)
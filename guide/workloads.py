@@ -0,0 +1,128 @@
+"""CPU-bound work for worker processes.
+
+This module does not import Streamlit, so a worker that imports it starts quickly.
+Run as a script, it is the worker of the subprocess strategy:
+
+    python -m guide.workloads <n> <payload_kb> <count>
+"""
+import base64
+import json
+import os
+import sys
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def count_primes(n: int, start: int = 2) -> int:
+    count = 0
+    for i in range(max(start, 2), n):
+        for d in range(2, int(i ** 0.5) + 1):
+            if i % d == 0:
+                break
+        else:
+            count += 1
+    return count
+
+
+def sweep(n: int, steps: int = 20, progress=None) -> int:
+    """Count the primes below `n` in `steps` chunks, reporting the fraction done after each."""
+    bounds = [2 + (n - 2) * i // steps for i in range(steps + 1)]
+    total = 0
+    for i, (lo, hi) in enumerate(zip(bounds, bounds[1:]), 1):
+        total += count_primes(hi, lo)
+        if progress is not None:
+            progress(i / steps)
+    return total
+
+
+def map_chunk(fn, items: list) -> list:
+    """guide.batch worker: `fn` applied to one chunk of inputs."""
+    return [fn(item) for item in items]
+
+
+def random_frame(rows: int, columns: int = 4, shared: bool = False):
+    """A DataFrame of random floats, or with `shared` its guide.shm handle."""
+    import numpy as np
+    import pandas as pd
+
+    from guide import shm
+
+    data = np.random.default_rng().random((rows, columns))
+    frame = pd.DataFrame(data, columns=[f"x{i}" for i in range(columns)], copy=False)
+    return shm.export(frame) if shared else frame
+
+
+def max_rss_kb() -> int | None:
+    # On Linux ru_maxrss survives exec, so a child would report its parent's peak; VmHWM does not.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def task(n: int, payload_kb: int) -> dict:
+    """Count the primes below `n` and return a `payload_kb` result, with timings for the benchmark."""
+    started = time.time()
+    result = count_primes(n)
+    return {
+        "pid": os.getpid(),
+        "result": result,
+        "payload": bytes(payload_kb * 1024),
+        "started": started,
+        "finished": time.time(),
+        "rss_kb": max_rss_kb(),
+    }
+
+
+def queue_worker(tasks, results):
+    """multiprocessing worker: run `(n, payload_kb)` tasks from one queue until None, results to another."""
+    for args in iter(tasks.get, None):
+        results.put(task(*args))
+
+
+def run_job(job_id: str, fn, args: tuple, kwargs: dict, events, counters: str, slot: int):
+    """guide.jobs worker: call `fn` with a `progress` callback and report the outcome as a `(job_id, kind, value)` event.
+
+    Progress goes to slot `slot` of the guide.shm Counters named `counters`, not through `events`,
+    so a job can report it as often as it likes.
+    """
+    from guide import shm
+
+    board = shm.Counters(name=counters)
+
+    def progress(fraction: float):
+        board[slot] = fraction
+
+    try:
+        result = fn(*args, progress=progress, **kwargs)
+    except BaseException:
+        events.put((job_id, "failed", traceback.format_exc()))
+    else:
+        events.put((job_id, "done", result))
+    finally:
+        board.close()
+
+
+def main():
+    n, payload_kb, count = map(int, sys.argv[1:4])
+    for _ in range(count):
+        record = task(n, payload_kb)
+        record["payload"] = base64.b64encode(record["payload"]).decode("ascii")
+        print(json.dumps(record), flush=True)
+
+
+if __name__ == "__main__":
+    main()
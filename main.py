@@ -1,14 +1,49 @@
+from contextlib import nullcontext
+
 import streamlit as st
 
+from guide import assets, profiler, registry, search
+
+# Load the page images and the search index once per process, before the first page needs them.
+assets.get_store()
+search.get_index()
+
+# The profiler covers the whole script, the sidebar included; the page is known once navigation has run.
+profile = profiler.Profiler() if profiler.enabled() else None
+
+with profile.run() if profile else nullcontext():
+    if "language" not in st.session_state:
+        st.session_state["language"] = registry.initial_language().upper()
+
+    lang = st.sidebar.radio("Language", ["EN", "JP"], key="language")
+    query = st.sidebar.text_input("検索" if lang == "JP" else "Search", key="search")
+    one_section = st.sidebar.toggle("1 セクションずつ表示" if lang == "JP" else "One section at a time", key="one_section")
+
+    suffix = lang.lower()
+
+    # Keep the choice in the URL, so a reload or a shared link opens in the same language.
+    if st.query_params.get("lang") != suffix:
+        st.query_params["lang"] = suffix
+
+    pages = registry.build(suffix, one_section)
 
-lang = st.sidebar.radio("Language", ["EN", "JP"], index=1, key="language")
+    current = st.navigation(list(pages.values()), position="sidebar", expanded=True)
 
-suffix = lang.lower()
+    if query:
+        hits = search.get_index().search(query, suffix)
+        for _, page, section, heading in hits:
+            anchor = f"#{section}" if section else ""
+            # Links within the current page only scroll; other pages, and any page while only one
+            # section is shown, open at the section.
+            on_page = pages[page] == current and anchor and not one_section
+            url = anchor if on_page else f"./{pages[page].url_path}?lang={suffix}{anchor}"
+            st.sidebar.markdown(f"[{pages[page].title} › {heading}]({url})")
+        if not hits:
+            st.sidebar.caption("見つかりませんでした" if lang == "JP" else "No matches")
 
-pages = [
-    st.Page(f"contents/introduction_{suffix}.py", title="はじめに" if lang == "JP" else "Introduction", icon=":material/home:"),
-    st.Page(f"contents/handson_{suffix}.py", title="作ってみよう" if lang == "JP" else "Hands-on", icon=":material/build:"),
-    st.Page(f"contents/tips_{suffix}.py", title="開発のコツ" if lang == "JP" else "Tips", icon=":material/lightbulb_2:"),
-]
+    current.run()
 
-st.navigation(pages, position="sidebar", expanded=True).run()
+if profile:
+    profile.page = next(name for name, page in pages.items() if page == current)
+    profile.save()
+    profile.panel()
@@ -0,0 +1,76 @@
+import gc
+import time
+
+import pytest
+
+from guide.batch import MAX_INPUTS, BatchMap
+from guide.scheduler import Scheduler
+
+
+def _wait_done(batch: BatchMap):
+    deadline = time.monotonic() + 30
+    while not batch.done:
+        assert time.monotonic() < deadline, "the batch did not finish"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = Scheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_read_returns_results_since_cursor(scheduler):
+    batch = BatchMap(scheduler, abs, range(-50, 0), size=7, session="a")
+    _wait_done(batch)
+    results, cursor = batch.read()
+    assert sorted(results) == [(i, 50 - i) for i in range(50)]
+    assert cursor == batch.completed == batch.total == 50
+    assert batch.read(cursor) == ([], 50)
+    assert batch.read(45) == (results[45:], 50)
+    assert batch.error is None
+
+
+def test_chunks_run_on_every_worker(scheduler):
+    batch = BatchMap(scheduler, time.sleep, [0.3 + i / 1000 for i in range(8)], size=1, session="a")
+    deadline = time.monotonic() + 30
+    while scheduler.stats()["running"] < 2:
+        assert time.monotonic() < deadline, "the batch never ran on both workers"
+        time.sleep(0.01)
+    _wait_done(batch)
+    assert batch.completed == 8
+
+
+def test_identical_chunks_are_all_collected(scheduler):
+    batch = BatchMap(scheduler, abs, [-1, -2] * 10, size=2, session="a")
+    _wait_done(batch)
+    assert sorted(batch.read()[0]) == [(i, 1 + i % 2) for i in range(20)]
+
+
+def test_cancel_stops_submitting(scheduler):
+    batch = BatchMap(scheduler, time.sleep, [0.2 + i / 1000 for i in range(40)], size=1, session="a")
+    batch.cancel()
+    _wait_done(batch)
+    assert batch.completed < batch.total
+    assert scheduler.stats()["queued"]["low"] == 0
+
+
+def test_dropped_batch_stops(scheduler):
+    batch = BatchMap(scheduler, time.sleep, [0.2 + i / 1000 for i in range(40)], size=1, session="a")
+    collector = batch._collector
+    del batch
+    gc.collect()
+    collector.join(timeout=30)
+    assert not collector.is_alive()
+
+
+def test_failed_chunk_is_reported(scheduler):
+    batch = BatchMap(scheduler, int, ["1", "x", "3"], size=1, session="a")
+    _wait_done(batch)
+    assert isinstance(batch.error, ValueError)
+
+
+def test_too_many_inputs(scheduler):
+    with pytest.raises(ValueError):
+        BatchMap(scheduler, abs, range(MAX_INPUTS + 1), session="a")
@@ -0,0 +1,50 @@
+import pytest
+
+from guide.content import nl, parse
+
+SOURCE = """\
+::page Tips
+::title Development tips
+::markdown
+Before the first section.
+::section git Using Git
+::markdown
+Line one{nl}
+line two
+::expander Details
+::caption
+Inside the expander.
+::end
+::image data/dev_env.png
+"""
+
+
+def test_parse_sections_and_nodes():
+    page = parse(SOURCE)
+    assert page["page_title"] == "Tips"
+    assert page["title"] == "Development tips"
+    top, git = page["sections"]
+    assert top["id"] is None and top["heading"] is None
+    assert [node[0] for node in top["nodes"]] == ["set_page_config", "title", "markdown"]
+    assert git["id"] == "git" and git["heading"] == "Using Git"
+    assert [node[0] for node in git["nodes"]] == ["subheader", "markdown", "expander", "image"]
+    assert git["nodes"][0][2] == {"divider": True, "anchor": "git"}
+    assert git["nodes"][1][1] == [f"Line one{nl}\nline two"]
+
+
+def test_parse_expander_children():
+    expander = parse(SOURCE)["sections"][1]["nodes"][2]
+    assert expander[1] == ["Details"]
+    assert expander[2] == {"key": "git-expander-0", "on_change": "rerun"}
+    assert expander[3] == [["caption", ["Inside the expander."], {}, []]]
+
+
+@pytest.mark.parametrize("source, message", [
+    ("stray text\n", "line 1: text outside of a directive"),
+    ("::end\n", "line 1: ::end without ::expander"),
+    ("::expander A\n::section s S\n", "line 2: section inside an expander"),
+    ("::markdown\nok\n::bogus\n", "line 3: unknown directive ::bogus"),
+])
+def test_parse_errors(source, message):
+    with pytest.raises(ValueError, match=message):
+        parse(source)
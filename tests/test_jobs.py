@@ -0,0 +1,61 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from guide import workloads
+from guide.jobs import CANCELLED, DONE, FAILED, PENDING, RUNNING, Job, JobManager
+
+
+def _wait_status(manager: JobManager, job_id: str, *statuses: str):
+    deadline = time.monotonic() + 30
+    while manager.get(job_id).status not in statuses:
+        assert time.monotonic() < deadline, f"job {job_id} is still {manager.get(job_id).status}"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def test_cancelled_job_frees_its_slot(manager):
+    first = manager.submit(workloads.sweep, 10_000_000)
+    _wait_status(manager, first, RUNNING)
+    second = manager.submit(workloads.sweep, 1000)
+    assert manager.get(second).status == PENDING
+    assert manager.cancel(first)
+    assert manager.get(first).status == CANCELLED
+    _wait_status(manager, second, DONE)
+    assert manager.get(second).result == workloads.sweep(1000)
+    third = manager.submit(workloads.sweep, 2000)
+    _wait_status(manager, third, DONE)
+
+
+def test_slot_is_held_until_the_worker_exits(manager):
+    job = Job("exiting", workloads.sweep, (1000,), {})
+    job.status, job.finished, job._slot, job._process = DONE, time.time(), 0, SimpleNamespace(exitcode=None)
+    with manager._lock:
+        manager._jobs[job.id] = job
+        manager._free_slots.clear()
+        manager._release_slots()
+        assert manager._free_slots == [] and job._slot == 0
+        job._process.exitcode = 0
+        manager._release_slots()
+        manager._release_slots()
+        assert manager._free_slots == [0] and job._slot is None
+
+
+def test_shutdown_fails_unfinished_jobs(manager):
+    running = manager.submit(workloads.sweep, 10_000_000)
+    pending = manager.submit(workloads.sweep, 1000)
+    _wait_status(manager, running, RUNNING)
+    process = manager.get(running)._process
+    manager.shutdown()
+    assert process.exitcode is not None
+    assert [manager.get(job_id).status for job_id in (running, pending)] == [FAILED, FAILED]
+    assert not manager._pumping.is_alive()
+    with pytest.raises(RuntimeError):
+        manager.submit(workloads.sweep, 1000)
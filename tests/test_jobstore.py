@@ -0,0 +1,61 @@
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+
+from guide.jobstore import JobStore, _alive, process_owner
+
+
+def _record(job_id: str, status: str) -> dict:
+    return {
+        "id": job_id, "name": "sweep", "status": status, "progress": 0.0, "result": None, "error": None,
+        "submitted": 1.0, "started": None, "finished": None,
+    }
+
+
+def _dead_owner() -> str:
+    proc = subprocess.run([sys.executable, "-c", "from guide.jobstore import process_owner; print(process_owner())"], capture_output=True, text=True)
+    return proc.stdout.strip()
+
+
+def test_alive():
+    assert _alive(process_owner())
+    assert not _alive(None)
+    assert not _alive(_dead_owner())
+    # The same PID with another start time is a different process.
+    assert not _alive(f"{os.getpid()}:0")
+
+
+def test_save_and_load(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    store.save({**_record("a", "done"), "result": {"primes": 3}})
+    assert store.load("a")["result"] == {"primes": 3}
+    assert store.load("missing") is None
+
+
+def test_interrupt_only_orphaned_jobs(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path)
+    store.save(_record("mine", "running"), _record("finished", "done"))
+    orphan = JobStore(path)
+    orphan.owner = _dead_owner()
+    orphan.save(_record("orphan", "running"))
+    store.interrupt(["pending", "running"], "failed", "interrupted")
+    assert [store.load(job_id)["status"] for job_id in ("mine", "finished", "orphan")] == ["running", "done", "failed"]
+    assert store.load("orphan")["error"] == "interrupted"
+
+
+def test_legacy_rows_without_owner_are_interrupted(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE jobs (id TEXT PRIMARY KEY, name TEXT, status TEXT, progress REAL,"
+        " result BLOB, error TEXT, submitted REAL, started REAL, finished REAL)"
+    )
+    db.execute("INSERT INTO jobs (id, name, status, progress, result, submitted) VALUES ('old', 'sweep', 'running', 0.5, ?, 1.0)", (pickle.dumps(None),))
+    db.commit()
+    db.close()
+    store = JobStore(path)
+    store.interrupt(["pending", "running"], "failed", "interrupted")
+    assert store.load("old")["status"] == "failed"
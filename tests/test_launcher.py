@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import threading
+import types
+from pathlib import Path
+
+from guide import launcher
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_detached_main_swaps_and_restores_main():
+    main = sys.modules["__main__"]
+    with launcher.detached_main():
+        assert sys.modules["__main__"] is not main
+        assert not hasattr(sys.modules["__main__"], "__file__")
+        # A block may start a pool that starts processes of its own.
+        with launcher.detached_main():
+            pass
+    assert sys.modules["__main__"] is main
+
+
+def test_detached_main_threads_take_turns():
+    main = sys.modules["__main__"]
+    inside = threading.Barrier(2, timeout=0.2)
+    overlapped = []
+
+    def detach():
+        with launcher.detached_main():
+            try:
+                inside.wait()
+                overlapped.append(True)
+            except threading.BrokenBarrierError:
+                pass
+
+    threads = [threading.Thread(target=detach) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not overlapped
+    assert sys.modules["__main__"] is main
+
+
+def test_pool_exits_cleanly_while_warming_up():
+    # Exiting while workers are still starting used to print their tracebacks.
+    proc = subprocess.run(
+        [sys.executable, "-c", "from guide import launcher; launcher.pool(2)"], cwd=ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0
+    assert proc.stderr == ""
+
+
+def test_detached_main_keeps_a_main_installed_meanwhile():
+    main = sys.modules["__main__"]
+    script = types.ModuleType("__main__")
+    try:
+        with launcher.detached_main():
+            # What Streamlit's script runner does when a run starts.
+            sys.modules["__main__"] = script
+        assert sys.modules["__main__"] is script
+    finally:
+        sys.modules["__main__"] = main
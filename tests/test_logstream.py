@@ -0,0 +1,49 @@
+import sys
+import time
+
+from guide.logstream import LogStream
+
+
+def _finish(stream: LogStream) -> int:
+    deadline = time.monotonic() + 30
+    while stream.returncode is None:
+        assert time.monotonic() < deadline, "the worker did not exit"
+        time.sleep(0.01)
+    return stream.returncode
+
+
+def _printer(count: int) -> list[str]:
+    return [sys.executable, "-c", f"for i in range({count}): print(f'line {{i}}')"]
+
+
+def test_read_returns_only_new_lines():
+    stream = LogStream(_printer(5))
+    assert _finish(stream) == 0
+    lines, cursor = stream.read()
+    assert lines == [f"line {i}" for i in range(5)] and cursor == 5
+    assert stream.read(cursor) == ([], 5)
+    assert stream.read(3) == (["line 3", "line 4"], 5)
+
+
+def test_buffer_drops_oldest_lines():
+    stream = LogStream(_printer(100), max_lines=10)
+    _finish(stream)
+    assert stream.dropped == 90
+    lines, cursor = stream.read()
+    assert lines == [f"line {i}" for i in range(90, 100)] and cursor == 100
+    # A cursor into lines already dropped skips to the oldest one kept.
+    assert stream.read(50)[0] == lines
+
+
+def test_buffer_limits_characters():
+    stream = LogStream(_printer(100), max_chars=70)
+    _finish(stream)
+    assert stream.size <= 70
+    assert stream.read()[0][-1] == "line 99"
+
+
+def test_undecodable_output_is_replaced():
+    script = "import sys; sys.stdout.buffer.write(b'bad \\xff byte\\n'); print('after')"
+    stream = LogStream([sys.executable, "-c", script])
+    assert _finish(stream) == 0
+    assert stream.read()[0] == ["bad � byte", "after"]
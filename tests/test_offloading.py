@@ -0,0 +1,38 @@
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from guide import launcher
+
+
+def _page():
+    from guide import offloading
+
+    offloading.show("en")
+
+
+@pytest.fixture
+def page():
+    at = AppTest.from_function(_page, default_timeout=60)
+    yield at
+    # Shuts down the scheduler the page started.
+    st.cache_resource.clear()
+
+
+def _settle(at: AppTest):
+    # A run installs its script as `__main__`; one during a worker's start would hand it the script.
+    for warmup in list(launcher._pools.values()):
+        warmup.join()
+    for _, future in at.session_state["computations"]:
+        future.result(timeout=60)
+
+
+def test_computations_are_reattached_from_url(page):
+    page.query_params["calc"] = ["1000", "999999999999", "x"]
+    page.run()
+    assert [n for n, _ in page.session_state["computations"]] == [1000]
+    # Values the form could not have asked for are dropped.
+    assert page.query_params["calc"] == "1000"
+    _settle(page)
+    page.run()
+    assert any("168" in element.value for element in page.markdown)
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+MAIN = str(Path(__file__).resolve().parent.parent / "main.py")
+
+
+def _open(page: str, one_section: bool) -> AppTest:
+    at = AppTest.from_file(MAIN, default_timeout=60)
+    at.query_params["lang"] = "en"
+    at.run()
+    at._page_hash = next(h for h, info in at._registered_pages.items() if info.get("url_pathname") == page)
+    at.toggle(key="one_section").set_value(one_section)
+    at.run()
+    assert not at.exception
+    return at
+
+
+def test_reading_mode_keeps_the_introduction():
+    at = _open("handson", one_section=True)
+    text = "\n".join(m.value for m in at.markdown)
+    assert "entire development process" in text
+    assert [s.value for s in at.subheader] == ["Development Environment"]
+
+
+def test_reading_mode_shows_the_chosen_section():
+    at = _open("handson", one_section=True)
+    at.sidebar.radio(key="toc-handson").set_value("setting-up-the-local-environment")
+    at.run()
+    assert [s.value for s in at.subheader] == ["Setting Up the Local Environment"]
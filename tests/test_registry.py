@@ -0,0 +1,16 @@
+import pytest
+
+from guide.registry import DEFAULT_LANGUAGE, detect_language
+
+
+@pytest.mark.parametrize("header, lang", [
+    ("ja,en-US;q=0.8", "jp"),
+    ("en-US,ja;q=0.5", "en"),
+    ("fr-FR,en;q=0.3,ja;q=0.7", "jp"),
+    ("EN", "en"),
+    ("en;q=abc,ja;q=0.1", "jp"),
+    ("fr,de", DEFAULT_LANGUAGE),
+    ("", DEFAULT_LANGUAGE),
+])
+def test_detect_language(header, lang):
+    assert detect_language(header) == lang
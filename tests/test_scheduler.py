@@ -0,0 +1,112 @@
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from guide.scheduler import HIGH, LOW, NORMAL, QuotaExceeded, Scheduler
+
+
+def _wait_running(scheduler: Scheduler, count: int):
+    deadline = time.monotonic() + 30
+    while scheduler.stats()["running"] != count:
+        assert time.monotonic() < deadline, "tasks were not dispatched"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def make_scheduler():
+    schedulers = []
+
+    def make(**kwargs) -> Scheduler:
+        schedulers.append(Scheduler(**kwargs))
+        return schedulers[-1]
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.shutdown()
+
+
+def test_identical_calls_share_one_future(make_scheduler):
+    scheduler = make_scheduler()
+    first = scheduler.submit(time.sleep, 0.2, session="a")
+    assert scheduler.submit(time.sleep, 0.2, session="b") is first
+    first.result(timeout=30)
+    assert scheduler.submit(time.sleep, 0.2, session="c") is first
+    stats = scheduler.stats()
+    assert (stats["submitted"], stats["shared"], stats["cache_hits"]) == (3, 1, 1)
+
+
+def test_private_calls_are_not_shared(make_scheduler):
+    scheduler = make_scheduler()
+    first = scheduler.submit(pow, 2, 8, session="a", dedupe=False)
+    second = scheduler.submit(pow, 2, 8, session="a", dedupe=False)
+    assert first is not second
+    assert first.result(timeout=30) == second.result(timeout=30) == 256
+    assert scheduler.stats()["cached"] == 0
+
+
+def test_quota_limits_waiting_tasks(make_scheduler):
+    scheduler = make_scheduler(per_session=1, max_queued=2)
+    scheduler.submit(time.sleep, 0.5, session="a")
+    _wait_running(scheduler, 1)
+    scheduler.submit(pow, 2, 1, session="a")
+    scheduler.submit(pow, 2, 2, session="a")
+    with pytest.raises(QuotaExceeded):
+        scheduler.submit(pow, 2, 3, session="a")
+    # Other sessions have quotas of their own.
+    assert scheduler.submit(pow, 2, 3, session="b").result(timeout=30) == 8
+
+
+def test_higher_priorities_run_first(make_scheduler):
+    scheduler = make_scheduler(max_workers=1)
+    blocker = scheduler.submit(time.sleep, 0.5, session="blocker")
+    _wait_running(scheduler, 1)
+    finished = []
+    for priority in [LOW, NORMAL, HIGH]:
+        future = scheduler.submit(pow, 3, len(priority), session=priority, priority=priority)
+        future.add_done_callback(lambda _, priority=priority: finished.append(priority))
+    assert scheduler.stats()["queued"] == {HIGH: 1, NORMAL: 1, LOW: 1}
+    blocker.result(timeout=30)
+    deadline = time.monotonic() + 30
+    while len(finished) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert finished == [HIGH, NORMAL, LOW]
+
+
+def test_unknown_priority_registers_nothing(make_scheduler):
+    scheduler = make_scheduler()
+    with pytest.raises(ValueError):
+        scheduler.submit(pow, 2, 4, session="a", priority="urgent")
+    assert scheduler.submit(pow, 2, 4, session="a").result(timeout=30) == 16
+
+
+def test_crashed_worker_does_not_stop_the_scheduler(make_scheduler):
+    scheduler = make_scheduler()
+    with pytest.raises(BrokenProcessPool):
+        scheduler.submit(os._exit, 1, session="a").result(timeout=30)
+    assert scheduler.submit(pow, 2, 5, session="a").result(timeout=30) == 32
+    stats = scheduler.stats()
+    assert stats["running"] == 0 and stats["failed"] == 1
+
+
+def test_shutdown_cancels_waiting_tasks(make_scheduler):
+    scheduler = make_scheduler(per_session=1)
+    running = scheduler.submit(time.sleep, 0.3, session="a")
+    _wait_running(scheduler, 1)
+    waiting = scheduler.submit(pow, 2, 4, session="a")
+    scheduler.shutdown()
+    assert waiting.cancelled()
+    assert running.result(timeout=30) is None
+    with pytest.raises(RuntimeError):
+        scheduler.submit(pow, 2, 5, session="a")
+
+
+def test_task_may_raise_its_session_limit(make_scheduler):
+    scheduler = make_scheduler(max_workers=2, per_session=1)
+    scheduler.submit(time.sleep, 0.5, session="a")
+    scheduler.submit(time.sleep, 0.6, session="a", per_session=2)
+    _wait_running(scheduler, 2)
+    scheduler.submit(time.sleep, 0.7, session="a", per_session=2)
+    time.sleep(0.1)
+    assert scheduler.stats()["queued"][NORMAL] == 1
@@ -0,0 +1,32 @@
+from guide.content import parse
+from guide.search import Index
+
+
+def _index() -> Index:
+    index = Index()
+    en = parse("::title Tips\n::section git Using Git\n::markdown\nClone the repository with git clone.\n"
+               "::section venv Virtual environments\n::markdown\nCreate one with venv. Git is not needed.\n")
+    jp = parse("::title コツ\n::section git Git の使い方\n::markdown\nリポジトリをクローンします。\n")
+    for lang, page in [("en", en), ("jp", jp)]:
+        for section in page["sections"]:
+            index.add(lang, "tips", section, page["title"])
+    return index
+
+
+def test_search_needs_every_term():
+    index = _index()
+    assert [hit[2] for hit in index.search("git", "en")] == ["git", "venv"]
+    assert [hit[2] for hit in index.search("git clone", "en")] == ["git"]
+    assert index.search("git docker", "en") == []
+
+
+def test_search_stays_in_language():
+    index = _index()
+    assert [hit[0] for hit in index.search("git", "jp")] == ["jp"]
+
+
+def test_search_japanese_bigrams():
+    index = _index()
+    assert [hit[3] for hit in index.search("クローン", "jp")] == ["Git の使い方"]
+    assert index.search("ローカル", "jp") == []
+    assert index.search("", "jp") == []
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from guide import shm
+
+
+def test_array_roundtrip():
+    array = np.arange(12, dtype=np.int32).reshape(3, 4)
+    result = shm.attach(shm.export(array))
+    np.testing.assert_array_equal(result.value, array)
+    assert result.value.dtype == np.int32
+    result.release()
+
+
+def test_frame_roundtrip():
+    frame = pd.DataFrame({"a": np.arange(5, dtype=np.int64), "b": np.linspace(0, 1, 5)}, index=pd.RangeIndex(10, 20, 2))
+    result = shm.attach(shm.export(frame))
+    pd.testing.assert_frame_equal(result.value, frame)
+    result.release()
+
+
+def test_views_outlive_release():
+    result = shm.attach(shm.export(np.arange(1000, dtype=np.float64)))
+    view = result.value[10:20]
+    result.release()
+    assert view.sum() == sum(range(10, 20))
+
+
+def test_release_unlinks_segment():
+    handle = shm.export(np.ones(8))
+    shm.attach(handle).release()
+    with pytest.raises(FileNotFoundError):
+        shm.attach(handle)
+
+
+@pytest.mark.parametrize("value", [
+    np.array(["a", "b"]),
+    pd.DataFrame({"a": ["x", "y"]}),
+    pd.DataFrame({"a": [1, 2]}, index=["x", "y"]),
+])
+def test_export_rejects_unsupported(value):
+    with pytest.raises(ValueError):
+        shm.export(value)
+
+
+def test_counters_shared_by_name():
+    counters = shm.Counters(3)
+    other = shm.Counters(name=counters.name)
+    other[1] = 0.5
+    assert len(counters) == 3 and counters[0] == 0.0 and counters[1] == 0.5
+    other.close()
+    counters.close()
@@ -0,0 +1,36 @@
+"""Entry point of dist/startguide.pyz (copied into the archive as __main__.py).
+
+    python startguide.pyz [streamlit run options]
+
+The guide package is imported straight from the archive as precompiled bytecode. Streamlit needs
+the entry script and the files it reads on disk, so those are extracted once per archive into a
+local temporary directory, away from a slow home directory.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+archive = Path(sys.argv[0]).resolve()
+digest = hashlib.sha256(archive.read_bytes()).hexdigest()[:16]
+root = Path(tempfile.gettempdir()) / f"startguide-{digest}"
+marker = root / ".extracted"
+
+if not marker.exists():
+    with zipfile.ZipFile(archive) as zf:
+        members = [name for name in zf.namelist() if not name.endswith(".pyc") and name != "__main__.py"]
+        zf.extractall(root, members)
+    marker.touch()
+
+sys.path.insert(0, str(archive))
+# Worker processes started as `python -m guide.workloads` have to find the package in the archive too.
+os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [str(archive), os.environ.get("PYTHONPATH")]))
+os.chdir(root)
+
+from streamlit.web import cli  # noqa: E402
+
+# Nothing in the extracted copy changes, so there is no need to watch files for changes.
+sys.argv = ["streamlit", "run", "main.py", "--server.fileWatcherType", "none", *sys.argv[1:]]
+sys.exit(cli.main())
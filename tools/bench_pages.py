@@ -0,0 +1,90 @@
+"""Benchmark every page in both languages with AppTest and check it against a budget.
+
+Run from the project root:
+
+    python -m tools.bench_pages [--budget tools/page_budget.json] [--repeat 5]
+
+Each page is run cold (all st.cache_resource caches cleared) and then rerun `--repeat` times.
+The page script time, the number of deltas and their serialized size come from guide.profiler.
+Exits with status 1 if any page is over its budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from guide.content import LANGUAGES
+from guide.registry import PAGES
+
+METRICS = ["cold_ms", "warm_ms", "deltas", "delta_bytes"]
+
+
+def _goto(at: AppTest, page: str):
+    # AppTest.switch_page only knows file-based pages; ours are callables registered by url_path.
+    for i, (page_hash, info) in enumerate(at._registered_pages.items()):
+        if info.get("url_pathname") == page or (i == 0 and list(PAGES)[0] == page):
+            at._page_hash = page_hash
+            return
+    raise KeyError(page)
+
+
+def _run(at: AppTest, log: Path) -> tuple[float, dict]:
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed, json.loads(log.read_text(encoding="utf-8").splitlines()[-1])
+
+
+def measure(page: str, lang: str, repeat: int, log: Path) -> dict:
+    at = AppTest.from_file(str(Path("main.py").resolve()), default_timeout=60)
+    at.query_params["lang"] = lang
+    at.query_params["profile"] = "1"
+    at.run()
+    _goto(at, page)
+    st.cache_resource.clear()
+    cold_ms, profile = _run(at, log)
+    warm = [_run(at, log)[0] for _ in range(repeat)]
+    return {
+        "cold_ms": round(cold_ms, 1),
+        "warm_ms": round(statistics.median(warm), 1),
+        "script_ms": profile["script_ms"],
+        "deltas": profile["delta_count"],
+        "delta_bytes": profile["delta_bytes"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", default="tools/page_budget.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    budget = json.loads(Path(args.budget).read_text(encoding="utf-8"))
+    log = Path(tempfile.mkdtemp()) / "profile.jsonl"
+    os.environ["GUIDE_PROFILE_LOG"] = str(log)
+    os.environ["GUIDE_PROFILE"] = "allow"
+
+    failed = False
+    print(f"{'page':<16}" + "".join(f"{m:>14}" for m in ["cold_ms", "warm_ms", "script_ms", "deltas", "delta_bytes"]))
+    for page in PAGES:
+        for lang in LANGUAGES:
+            result = measure(page, lang, args.repeat, log)
+            limits = {**budget["default"], **budget.get("pages", {}).get(page, {})}
+            over = [m for m in METRICS if result[m] > limits[m]]
+            failed |= bool(over)
+            row = "".join(f"{result[m]:>14}" for m in ["cold_ms", "warm_ms", "script_ms", "deltas", "delta_bytes"])
+            print(f"{page + '_' + lang:<16}{row}" + (f"  over budget: {', '.join(over)}" if over else ""))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
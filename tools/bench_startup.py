@@ -0,0 +1,151 @@
+"""Measure how long `streamlit run main.py` takes to come up, and compare with a stored baseline.
+
+Run from the project root:
+
+    python -m tools.bench_startup [--save-baseline] [--tolerance 0.25]
+
+Reported, each in a fresh process:
+- streamlit_import_ms: `import streamlit`, from `python -X importtime` (full output in build/importtime.txt)
+- server_ready_ms: from launching a headless server until /_stcore/health answers, which it does
+  before main.py has run at all
+- first_page_ms: from launching the same server until the first script run of a real session,
+  opened over the websocket like a browser would, has finished
+- discovery_ms: importing the guide package and loading the images, content bundles and search index
+- first_script_ms: the first run of main.py with the default page, through AppTest, in-process
+
+Exits with status 1 if a number is more than `--tolerance` above build/startup_baseline.json.
+"""
+import argparse
+import json
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.sync.client import connect
+
+BASELINE_PATH = Path("build/startup_baseline.json")
+IMPORTTIME_PATH = Path("build/importtime.txt")
+
+_FIRST_RUN = """
+import json, time
+from pathlib import Path
+from streamlit.testing.v1 import AppTest
+
+start = time.perf_counter()
+from guide import assets, content, search
+assets.get_store()
+for lang in content.LANGUAGES:
+    content.load_bundle(lang)
+search.get_index()
+discovery_ms = (time.perf_counter() - start) * 1000
+
+at = AppTest.from_file(str(Path("main.py").resolve()), default_timeout=60)
+start = time.perf_counter()
+at.run()
+print(json.dumps({"discovery_ms": discovery_ms, "first_script_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    # Lines look like "import time:       123 |       4567 |   streamlit.runtime"
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure_first_run() -> dict:
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", _FIRST_RUN], capture_output=True, text=True, check=True)
+    IMPORTTIME_PATH.parent.mkdir(parents=True, exist_ok=True)
+    IMPORTTIME_PATH.write_text(proc.stderr, encoding="utf-8")
+    imports = _import_times(proc.stderr)
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    slowest = sorted(((us, name) for name, us in imports.items() if "." not in name), reverse=True)[:10]
+    return {
+        "streamlit_import_ms": imports["streamlit"] / 1000,
+        **timings,
+        "_slowest_imports": [f"{name} {us / 1000:.1f} ms" for us, name in slowest],
+    }
+
+
+def _first_page(port: int, timeout: float):
+    """Open a session as the browser does and wait until its first script run has finished."""
+    with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], open_timeout=timeout, max_size=None) as ws:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        ws.send(msg.SerializeToString())
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(ws.recv(timeout=timeout))
+            if reply.WhichOneof("type") == "script_finished":
+                if reply.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    raise RuntimeError(f"the first script run ended with {ForwardMsg.ScriptFinishedStatus.Name(reply.script_finished)}")
+                return
+
+
+def measure_server(timeout: float = 60) -> dict:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "main.py", "--server.headless", "true", "--server.port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError(f"server did not answer within {timeout} s")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                    if response.status == 200:
+                        break
+            except OSError:
+                time.sleep(0.05)
+        server_ready_ms = (time.perf_counter() - start) * 1000
+        _first_page(port, timeout)
+        return {"server_ready_ms": server_ready_ms, "first_page_ms": (time.perf_counter() - start) * 1000}
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    result = measure_first_run()
+    result.update(measure_server())
+    slowest = result.pop("_slowest_imports")
+
+    baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")) if BASELINE_PATH.is_file() else {}
+    regressed = False
+    for name, value in result.items():
+        line = f"{name:<20}{value:>10.1f} ms"
+        if name in baseline:
+            change = value / baseline[name] - 1
+            regressed |= change > args.tolerance
+            line += f"   baseline {baseline[name]:>8.1f} ms  {change:+.0%}"
+        print(line)
+    print("slowest top-level imports:", ", ".join(slowest))
+
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"baseline saved to {BASELINE_PATH}")
+    elif regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
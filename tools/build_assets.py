@@ -0,0 +1,29 @@
+"""Build resized WebP/AVIF variants of data/*.png into static/img and write build/assets.json.
+
+Run from the project root:
+
+    python -m tools.build_assets
+"""
+import json
+import shutil
+from pathlib import Path
+
+from guide import assets
+
+
+def main():
+    shutil.rmtree(assets.VARIANT_DIR, ignore_errors=True)
+    assets.VARIANT_DIR.mkdir(parents=True)
+    manifest = {}
+    for source in sorted(Path("data").glob("*.png")):
+        entry = assets.build(source)
+        manifest[source.as_posix()] = entry
+        width = min(assets.CONTENT_WIDTH, entry["width"])
+        served = [v["bytes"] for v in entry["variants"] if v["format"] == "webp" and v["width"] == width]
+        print(f"{source}: {source.stat().st_size} -> {served[0] if served else '-'} bytes at {width}px")
+    assets.MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    assets.MANIFEST_PATH.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compile contents/*.md into one bundle per language under build/.
+
+Run from the project root:
+
+    python -m tools.compile_content
+
+For every page it also reports the messages and serialized bytes its content sends before and
+after coalescing (guide.content.coalesce), measured by replaying both through AppTest with
+guide.profiler. Images are only coalesced once they have static variants, so run
+`python -m tools.build_assets` first; without its manifest only markdown runs are merged.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from guide import assets, content
+
+
+def _replay(nodes: list):
+    # Runs as an AppTest script.
+    from guide import content, profiler
+
+    profile = profiler.Profiler()
+    with profile.run():
+        content.replay(nodes)
+    profile.save()
+
+
+def _measure(nodes: list, log: Path) -> dict:
+    at = AppTest.from_function(_replay, args=(nodes,), default_timeout=60)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return json.loads(log.read_text(encoding="utf-8").splitlines()[-1])
+
+
+def main():
+    log = Path(tempfile.mkdtemp()) / "profile.jsonl"
+    os.environ["GUIDE_PROFILE_LOG"] = str(log)
+    if not assets.manifest_mtime():
+        print("no image manifest: images are not coalesced until `python -m tools.build_assets` has run")
+    for lang in content.LANGUAGES:
+        print(f"{lang} -> {content.write_bundle(lang)}")
+        for page, data in content.load_bundle(lang)["pages"].items():
+            before = [node for s in data["sections"] for node in s["nodes"]]
+            after = [node for s in content.sections(page, lang) for node in s["nodes"]]
+            old, new = _measure(before, log), _measure(after, log)
+            print(
+                f"  {page}: {old['delta_count']} -> {new['delta_count']} messages,"
+                f" {old['delta_bytes']:,} -> {new['delta_bytes']:,} bytes after coalescing"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Build dist/startguide.pyz, a single archive the server can run directly.
+
+Run from the project root:
+
+    python -m tools.package
+    python dist/startguide.pyz --server.port 8501
+
+The guide package goes in as bytecode compiled with `-OO`, next to main.py, the config, the content
+sources and bundles, the images and their static variants. The content bundles and image variants
+are rebuilt first.
+"""
+import importlib.util
+import py_compile
+import tempfile
+import zipfile
+from pathlib import Path
+
+from tools import build_assets, compile_content
+
+ARCHIVE_PATH = Path("dist/startguide.pyz")
+
+FILES = ["main.py", ".streamlit/config.toml", "contents/*.md", "build/content_*.bundle", "build/assets.json", "data/*.png", "static/**/*.*"]
+
+
+def _compiled(source: Path, tmp: Path) -> Path:
+    out = tmp / source.with_suffix(".pyc")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    # Unchecked hash-based .pyc: nothing is stat'ed or compared against a source at import time.
+    py_compile.compile(
+        str(source), cfile=str(out), dfile=source.as_posix(), doraise=True, optimize=2,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+    return out
+
+
+def main():
+    compile_content.main()
+    build_assets.main()
+
+    ARCHIVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmp, zipfile.ZipFile(ARCHIVE_PATH, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.write("tools/archive_main.py", "__main__.py")
+        for source in sorted(Path("guide").glob("*.py")):
+            zf.write(_compiled(source, Path(tmp)), source.with_suffix(".pyc").as_posix())
+        for pattern in FILES:
+            for path in sorted(Path().glob(pattern)):
+                zf.write(path, path.as_posix())
+    print(f"{ARCHIVE_PATH}: {ARCHIVE_PATH.stat().st_size} bytes, Python {importlib.util.MAGIC_NUMBER.hex()} bytecode")
+
+
+if __name__ == "__main__":
+    main()